@@ -51,7 +51,6 @@ WHY THIS IS SEPARATE FROM THE OTHER MODULES:
 from __future__ import annotations
 
 import sys
-import multiprocessing
 
 # ── PyInstaller freeze support (MUST be called before any multiprocessing) ──
 # When running as a frozen binary (PyInstaller), multiprocessing spawns
@@ -60,14 +59,25 @@ import multiprocessing
 # causing an infinite spawn loop or silent crash.
 # This must be called as early as possible, before any imports that might
 # trigger multiprocessing or ProcessPoolExecutor usage.
-multiprocessing.freeze_support()
+#
+# Only needed when actually frozen — freeze_support() is a no-op otherwise,
+# so gating on sys.frozen lets normal Python runs (the common dev case)
+# skip importing multiprocessing entirely, saving ~15-40ms of startup.
+if getattr(sys, "frozen", False):
+    import multiprocessing
+    multiprocessing.freeze_support()
 
 import argparse
+import functools
+import os
+import re
 import time
 import logging
 
 from logging_config import setup_logging
 from config import Config
+from models import VideoPageRecord
+from rate_limit import TokenBucket
 
 # NOTE: Heavy imports (transcript, summarizer, notion_publisher) are done
 # LAZILY inside the functions that need them, not here at module level.
@@ -80,6 +90,22 @@ from config import Config
 
 logger = logging.getLogger("tubewise.agent")
 
+# Playlist URL detection, inlined from playlist.is_playlist_url so that
+# single-video runs (the common case) never import the playlist module —
+# keeping yt-dlp and friends off the hot CLI path. Must stay in sync with
+# the pattern in playlist.py.
+_PLAYLIST_URL_RE = re.compile(r"[?&]list=|/playlist\?list=")
+
+# Strips every character that isn't safe for a filename. A compiled regex
+# scrubs the title in one C-level pass instead of a per-character Python
+# generator calling .isalnum(). \w is Unicode-aware like isalnum() was,
+# so non-Latin titles keep their letters instead of scrubbing to nothing.
+_UNSAFE_FILENAME_RE = re.compile(r"[^\w _-]+")
+
+# Step/section separators, built once instead of per log call
+_SEP = "─" * 50
+_DSEP = "=" * 50
+
 
 def print_banner() -> None:
     """
@@ -94,12 +120,15 @@ def print_banner() -> None:
     """)
 
 
-def save_local_output(summary: str, video_title: str) -> str:
+def save_local_output(summary: str, video_title: str, out_dir: str = "",
+                      video_id: str = "") -> str:
     """
     Save the summary as a local Markdown file.
 
     This ALWAYS runs (even when publishing to Notion) as a backup.
-    The file is saved in the current directory with the video title as filename.
+    Single videos save into the current directory; playlist runs pass
+    out_dir to shard files into a per-playlist subdirectory, so hundreds
+    of summary files don't pile up in one flat directory.
 
     WHY:
     - Acts as a backup in case Notion publishing fails
@@ -109,110 +138,244 @@ def save_local_output(summary: str, video_title: str) -> str:
     Args:
         summary:     The raw summary text from Claude
         video_title: Video title (used to generate the filename)
+        out_dir:     Optional target directory (created if missing).
+                     Empty string means the current directory.
+        video_id:    Optional video ID; its first 8 chars are appended to
+                     the filename so same-titled videos don't clobber
+                     each other
 
     Returns:
-        The filename where the summary was saved
+        The path where the summary was saved
     """
-    safe_title = "".join(c for c in video_title if c.isalnum() or c in " -_").strip()
-    max_len = Config.FILENAME_MAX_LENGTH
-    safe_title = safe_title[:max_len] if len(safe_title) > max_len else safe_title
+    safe_title = _UNSAFE_FILENAME_RE.sub("", video_title).strip()[:Config.FILENAME_MAX_LENGTH]
+    if video_id:
+        safe_title = f"{safe_title}_{video_id[:8]}"
 
     filename = f"summary_{safe_title}.md"
+    if out_dir:
+        os.makedirs(out_dir, exist_ok=True)
+        filename = os.path.join(out_dir, filename)
 
-    with open(filename, "w", encoding="utf-8") as f:
-        f.write(f"# {video_title}\n\n")
-        f.write(summary)
+    # Encode once and hand the kernel a single buffer: one write syscall
+    # instead of two buffered text writes with incremental UTF-8 encoding
+    payload = f"# {video_title}\n\n{summary}".encode("utf-8")
+    with open(filename, "wb") as f:
+        f.write(payload)
 
     return filename
 
 
-def _process_single_url(url: str, no_notion: bool) -> None:
+def _process_single_url(url: str, no_notion: bool, language: str) -> None:
     """
     Run the full pipeline for a single YouTube video URL.
 
     Args:
         url:       The content URL to process
         no_notion: If True, skip Notion publishing
+        language:  Transcript language code
     """
     # ── Lazy imports: only load heavy deps when actually processing ──
     from transcript import fetch_video_info
-    from summarizer import generate_summary
     from notion_publisher import publish_to_notion
 
     # ── Step 1: Extract content information ──
-    logger.info("\n" + "=" * 50)
-    logger.info("STEP 1: Extracting Content Information")
-    logger.info("=" * 50)
+    # One log record per banner (instead of three) with %-style deferred
+    # formatting — the string is only built if the level is enabled, and
+    # each record means one lock acquire + flush instead of three.
+    logger.info("\n%s\nSTEP 1: Extracting Content Information\n%s", _DSEP, _DSEP)
 
-    content = fetch_video_info(url, Config.TRANSCRIPT_LANGUAGE)
+    content = fetch_video_info(url, language)
 
-    # ── Step 2: Generate AI summary ──
-    logger.info("\n" + "=" * 50)
-    logger.info("STEP 2: Generating AI Summary")
-    logger.info("=" * 50)
-    raw_summary = generate_summary(content)
+    # ── Step 2: Generate AI summary (cache-aware) ──
+    logger.info("\n%s\nSTEP 2: Generating AI Summary\n%s", _DSEP, _DSEP)
+    raw_summary = _generate_summary_cached(content)
 
     # ── Step 3: Save locally (always) ──
-    logger.info("\n" + "=" * 50)
-    logger.info("STEP 3: Saving Output")
-    logger.info("=" * 50)
+    logger.info("\n%s\nSTEP 3: Saving Output\n%s", _DSEP, _DSEP)
     local_file = save_local_output(raw_summary, content.title)
-    logger.info(f"💾 Local file saved: {local_file}")
+    logger.info("💾 Local file saved: %s", local_file)
 
     # ── Step 4: Publish to Notion (unless --no-notion) ──
     if not no_notion:
-        logger.info("\n" + "=" * 50)
-        logger.info("STEP 4: Publishing to Notion")
-        logger.info("=" * 50)
-        page_url = publish_to_notion(
-            raw_summary=raw_summary,
-            video_url=content.url,
-            video_title=content.title,
-            channel=content.creator,
-            duration=content.duration_formatted,
-            word_count=content.word_count,
-        )
-        logger.info(f"\n🎉 Notion page: {page_url}")
+        logger.info("\n%s\nSTEP 4: Publishing to Notion\n%s", _DSEP, _DSEP)
+        # Skip the POST entirely if this exact summary was already
+        # published on a previous run — reuse the existing page URL
+        import notion_cache
+
+        summary_hash = notion_cache.make_hash(raw_summary)
+        page_url = notion_cache.lookup(content.video_id, summary_hash)
+        if page_url is not None:
+            logger.info("📋 Already published (unchanged) — reusing page")
+        else:
+            page_url = publish_to_notion(
+                raw_summary=raw_summary,
+                video_url=content.url,
+                video_title=content.title,
+                channel=content.creator,
+                duration=content.duration_formatted,
+                word_count=content.word_count,
+            )
+            notion_cache.put(content.video_id, summary_hash, page_url)
+        logger.info("\n🎉 Notion page: %s", page_url)
     else:
         print("\n📋 Summary Output:")
         print("=" * 50)
         print(raw_summary)
 
 
-def _process_playlist(url: str, no_notion: bool) -> None:
+def _generate_summary_cached(content) -> str:
     """
-    Process an entire YouTube playlist — summarize each video and create
-    a Notion index page linking to all summaries.
+    Generate a summary, consulting the on-disk cache first.
+
+    Re-running TubeWise on a URL it has already processed skips the
+    Bedrock call entirely (milliseconds instead of seconds-to-minutes).
+    The cache key covers transcript + model + prompt version, so any
+    change to those regenerates. See llm_cache.py for details.
 
     Args:
-        url:       The playlist URL
-        no_notion: If True, skip Notion publishing
+        content: ContentInfo for the video
+
+    Returns:
+        Raw summary text (cached or freshly generated)
     """
-    # ── Lazy imports: only load heavy deps when actually processing ──
-    from transcript import fetch_video_info
+    import llm_cache
     from summarizer import generate_summary
-    from notion_publisher import publish_to_notion, create_playlist_index_page, get_notion_client
-    from playlist import get_playlist_videos
 
-    playlist_data = get_playlist_videos(url)
-    videos = playlist_data["videos"]
-    playlist_title = playlist_data["playlist_title"]
+    key = llm_cache.make_key(content.video_id, content.transcript)
+    cached = llm_cache.get(key)
+    if cached is not None:
+        logger.info("⚡ Using cached summary (skipping Bedrock call)")
+        return cached
+
+    raw_summary = generate_summary(content)
+    llm_cache.put(key, raw_summary)
+    return raw_summary
+
+
+# Caps YouTube requests at a global requests-per-second ceiling no
+# matter how many worker threads are fetching (see rate_limit.py).
+# Set by _process_playlist from --rps; None outside playlist runs (a
+# single video fetch has nothing to throttle against)
+_yt_bucket: TokenBucket | None = None
+
+
+def _sleep_with_jitter() -> None:
+    """
+    Pause briefly between playlist video fetches to stay under YouTube's
+    rate limits. Sleeps for the configured base delay plus a random jitter
+    so concurrent workers don't hit the API in lockstep.
+    """
+    import random
+
+    time.sleep(
+        Config.PLAYLIST_REQUEST_DELAY_SEC
+        + random.uniform(0, Config.PLAYLIST_REQUEST_JITTER_SEC)
+    )
 
-    logger.info(f"\n🎵 Playlist: {playlist_title} ({len(videos)} videos)")
 
-    video_pages = []
-    for i, video_entry in enumerate(videos):
-        logger.info(f"\n{'─' * 50}")
-        logger.info(f"📹 Video {i + 1}/{len(videos)}: {video_entry['title']}")
-        logger.info(f"{'─' * 50}")
+def _fetch_with_retry(url: str, language: str):
+    """
+    Fetch video info with exponential backoff on rate-limit errors.
+
+    youtube-transcript-api starts returning HTTP 429 ("Too Many Requests")
+    after a few hundred back-to-back requests. Retrying with exponential
+    backoff (1s, 2s, 4s... plus jitter) recovers from transient throttling
+    instead of failing the whole playlist run midway.
+
+    Args:
+        url:      The video URL to fetch
+        language: Transcript language code
+
+    Returns:
+        ContentInfo for the video
+
+    Raises:
+        Exception: Non-rate-limit errors immediately; rate-limit errors
+                   after Config.MAX_RETRIES attempts.
+    """
+    import random
+
+    from transcript import fetch_video_info
 
+    # At least one attempt even if MAX_RETRIES is configured to 0 —
+    # otherwise the loop body never runs and every fetch returns None
+    attempts = max(1, Config.MAX_RETRIES)
+    for attempt in range(attempts):
         try:
-            content = fetch_video_info(video_entry["url"], Config.TRANSCRIPT_LANGUAGE)
-            raw_summary = generate_summary(content)
-            save_local_output(raw_summary, content.title)
+            if _yt_bucket is not None:
+                _yt_bucket.acquire()
+            return fetch_video_info(url, language)
+        except Exception as e:
+            # Only back off on rate-limit-ish failures; anything else
+            # (bad URL, no captions) won't get better by waiting.
+            message = str(e).lower()
+            is_rate_limited = "429" in message or "too many requests" in message
+            if not is_rate_limited or attempt == attempts - 1:
+                raise
+            backoff = (2 ** attempt) + random.random()
+            logger.warning("   ⏳ Rate limited — retrying in %.1fs...", backoff)
+            time.sleep(backoff)
+
+
+def _summarize_one_video(video_entry: dict, language: str) -> tuple:
+    """
+    Pipeline stage 1 for one playlist entry: fetch transcript + summarize.
+
+    Runs on the summarize pool. Raises on failure — _process_playlist
+    catches the exception and records a "failed" entry, so one bad video
+    doesn't take down the whole playlist run.
+
+    Args:
+        video_entry: Dict with {id, title, url} from get_playlist_videos()
+        language:    Transcript language code
+
+    Returns:
+        Tuple of (content, raw_summary)
+    """
+    content = _fetch_with_retry(video_entry["url"], language)
+    raw_summary = _generate_summary_cached(content)
+    # Throttle before this worker picks up its next video
+    _sleep_with_jitter()
+    return content, raw_summary
+
+
+def _publish_one_video(video_entry: dict, content, raw_summary: str,
+                       no_notion: bool, out_dir: str = "") -> VideoPageRecord:
+    """
+    Pipeline stage 2 for one playlist entry: save locally + publish to Notion.
+
+    Runs on the publish pool, CONCURRENTLY with stage 1 of later videos —
+    the disk write and Notion POSTs for video i overlap the transcript
+    fetch and Bedrock call for video i+1. Never raises; failures are
+    captured in the returned dict's "status" field.
+
+    Args:
+        video_entry: Dict with {id, title, url} from get_playlist_videos()
+        content:     ContentInfo from stage 1
+        raw_summary: Summary text from stage 1
+        no_notion:   If True, skip Notion publishing
+        out_dir:     Per-playlist directory for the local summary file
+
+    Returns:
+        VideoPageRecord for the playlist index page
+    """
+    from notion_publisher import publish_to_notion
+    import notion_cache
 
-            notion_url = ""
-            if not no_notion:
+    try:
+        save_local_output(raw_summary, content.title, out_dir=out_dir,
+                          video_id=content.video_id)
+
+        notion_url = ""
+        if not no_notion:
+            # Dedup check: if this exact summary was already published on a
+            # previous run of the playlist, reuse the stored page URL
+            # instead of POSTing a duplicate page
+            summary_hash = notion_cache.make_hash(raw_summary)
+            cached_url = notion_cache.lookup(content.video_id, summary_hash)
+            if cached_url is not None:
+                notion_url = cached_url
+            else:
                 notion_url = publish_to_notion(
                     raw_summary=raw_summary,
                     video_url=content.url,
@@ -221,63 +384,171 @@ def _process_playlist(url: str, no_notion: bool) -> None:
                     duration=content.duration_formatted,
                     word_count=content.word_count,
                 )
-            video_pages.append({
-                "title": content.title,
-                "url": video_entry["url"],
-                "notion_url": notion_url,
-                "status": "success",
-            })
-            logger.info(f"   ✅ Done: {content.title}")
+                notion_cache.put(content.video_id, summary_hash, notion_url)
+        logger.info("   ✅ Done: %s", content.title)
+        return VideoPageRecord(
+            title=content.title,
+            url=video_entry["url"],
+            notion_url=notion_url,
+            status="success",
+        )
 
-        except Exception as e:
-            logger.error(f"   ❌ Failed: {video_entry['title']} — {e}")
-            video_pages.append({
-                "title": video_entry["title"],
-                "url": video_entry["url"],
-                "notion_url": "",
-                "status": f"failed: {e}",
-            })
-            continue
+    except Exception as e:
+        logger.error("   ❌ Failed: %s — %s", video_entry["title"], e)
+        return VideoPageRecord(
+            title=video_entry["title"],
+            url=video_entry["url"],
+            notion_url="",
+            status=f"failed: {e}",
+        )
+
+
+def _process_playlist(url: str, no_notion: bool, language: str,
+                      concurrency: int | None = None,
+                      rps: float | None = None) -> None:
+    """
+    Process an entire YouTube playlist — summarize each video and create
+    a Notion index page linking to all summaries.
+
+    Videos flow through a TWO-STAGE concurrent pipeline, each stage on its
+    own thread pool sized by Config.DEFAULT_WORKER_COUNT:
+
+      Stage 1 (summarize pool): transcript fetch + Bedrock summary
+      Stage 2 (publish pool):   local save + Notion publish
+
+    Fusing save+publish into a separate stage means the disk write and
+    Notion POSTs for one video overlap the transcript fetch and LLM call
+    of the next — neither stage idles behind the other. Threads (not
+    processes) are the right fit here: every expensive step is network
+    I/O that releases the GIL, so we get near-linear speedup without the
+    process-spawn/freeze_support overhead.
+
+    Args:
+        url:         The playlist URL
+        no_notion:   If True, skip Notion publishing
+        language:    Transcript language code
+        concurrency: Worker threads per pipeline stage (--concurrency);
+                     defaults to Config.DEFAULT_WORKER_COUNT
+        rps:         Global YouTube requests-per-second ceiling (--rps);
+                     defaults to Config.DEFAULT_YT_RPS
+    """
+    # ── Lazy imports: only load heavy deps when actually processing ──
+    from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+    from notion_publisher import create_playlist_index_page, get_notion_client
+    from playlist import get_playlist_videos
+
+    global _yt_bucket
+    workers = concurrency or Config.DEFAULT_WORKER_COUNT
+    _yt_bucket = TokenBucket(rps or Config.DEFAULT_YT_RPS)
+
+    playlist_data = get_playlist_videos(url)
+    videos = playlist_data["videos"]
+    playlist_title = playlist_data["playlist_title"]
+
+    logger.info("\n🎵 Playlist: %s (%d videos)", playlist_title, len(videos))
+
+    # One subdirectory per playlist keeps large runs out of the CWD —
+    # hundreds of files in one flat directory make every listing slow
+    safe_playlist = _UNSAFE_FILENAME_RE.sub("", playlist_title).strip()[:Config.FILENAME_MAX_LENGTH]
+    out_dir = os.path.join(Config.OUTPUT_DIR, safe_playlist or "playlist")
+
+    # Pre-size the results list and fill by index so the Notion index page
+    # preserves the original playlist order regardless of completion order.
+    video_pages: list[VideoPageRecord | None] = [None] * len(videos)
+
+    # Backpressure: publishing is rate-limited (~3 Notion calls/s), so it
+    # usually runs behind summarizing. Submitting every summarize task up
+    # front would let finished (content, summary) pairs — full transcripts
+    # included — pile up in the publish queue until most of the playlist
+    # sat in memory at once. Instead, at most `window` videos are in
+    # flight across both stages: a new summarize task is only submitted
+    # when a video leaves the pipeline (published or failed), so a slow
+    # stage 2 stalls stage 1 rather than buffering behind it.
+    window = workers * 2
+
+    with ThreadPoolExecutor(max_workers=workers) as summarize_pool, \
+         ThreadPoolExecutor(max_workers=workers) as publish_pool:
+        video_iter = iter(enumerate(videos))
+        summarize_futures = {}
+        publish_futures = {}
+        done = 0
+
+        def _submit_next() -> None:
+            """Feed the next video into stage 1, if any remain."""
+            for i, v in video_iter:
+                summarize_futures[
+                    summarize_pool.submit(_summarize_one_video, v, language)
+                ] = i
+                return
+
+        # Prime the pipeline with one window's worth of work
+        for _ in range(min(window, len(videos))):
+            _submit_next()
+
+        while summarize_futures or publish_futures:
+            ready, _ = wait(
+                summarize_futures.keys() | publish_futures.keys(),
+                return_when=FIRST_COMPLETED,
+            )
+            for future in ready:
+                if future in summarize_futures:
+                    # Summary landed — hand save+publish to the publish
+                    # pool. The video stays in flight, so no new submit.
+                    i = summarize_futures.pop(future)
+                    try:
+                        content, raw_summary = future.result()
+                    except Exception as e:
+                        logger.error("   ❌ Failed: %s — %s", videos[i]["title"], e)
+                        video_pages[i] = VideoPageRecord(
+                            title=videos[i]["title"],
+                            url=videos[i]["url"],
+                            notion_url="",
+                            status=f"failed: {e}",
+                        )
+                        done += 1
+                        _submit_next()
+                        continue
+                    publish_futures[
+                        publish_pool.submit(
+                            _publish_one_video, videos[i], content, raw_summary,
+                            no_notion, out_dir
+                        )
+                    ] = i
+                else:
+                    # Published — the video leaves the pipeline, freeing a
+                    # slot for the next summarize task
+                    i = publish_futures.pop(future)
+                    video_pages[i] = future.result()
+                    done += 1
+                    logger.info("📹 Progress: %d/%d videos processed", done, len(videos))
+                    _submit_next()
 
     # Create playlist index page on Notion
     if not no_notion and video_pages:
-        logger.info(f"\n📑 Creating playlist index page...")
+        logger.info("\n📑 Creating playlist index page...")
         client = get_notion_client()
         index_url = create_playlist_index_page(client, playlist_title, video_pages)
-        logger.info(f"🎉 Playlist index: {index_url}")
+        logger.info("🎉 Playlist index: %s", index_url)
 
     # Summary
-    succeeded = sum(1 for v in video_pages if v["status"] == "success")
+    succeeded = sum(1 for v in video_pages if v.status == "success")
     failed = len(video_pages) - succeeded
-    logger.info(f"\n📊 Playlist complete: {succeeded} succeeded, {failed} failed")
-
+    logger.info("\n📊 Playlist complete: %d succeeded, %d failed", succeeded, failed)
 
-def main() -> None:
-    """
-    Main function — the entry point of the entire agent.
 
-    Handles:
-    - Single video processing
-    - Playlist processing
-    - Async queue submission
-    - Queue status display
-    - Worker management
-    - Hidden --_daemon flag (for PyInstaller binary worker daemon)
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
     """
+    Construct the CLI argument parser.
 
-    # ── Hidden daemon entry point (PyInstaller binary only) ──
-    # When running as a frozen binary, `start_daemon()` in worker.py
-    # can't use `python -c "..."` because sys.executable IS the binary,
-    # not the Python interpreter. Instead, it re-invokes the binary with
-    # `--_daemon N` which we intercept here BEFORE argparse runs.
-    # This must happen early — no banner, no logging setup, just launch
-    # the daemon directly.
-    if len(sys.argv) >= 2 and sys.argv[1] == "--_daemon":
-        worker_count = int(sys.argv[2]) if len(sys.argv) >= 3 else Config.DEFAULT_WORKER_COUNT
-        from worker import _run_daemon
-        _run_daemon(worker_count)
-        return
+    Built once per process and memoized — repeated in-process invocations
+    (tests, embedding callers) reuse the same parser instead of paying the
+    argparse construction cost again.
 
+    Returns:
+        The configured ArgumentParser
+    """
     parser = argparse.ArgumentParser(
         description="🧠 TubeWise — Summarize YouTube content using AI and publish to Notion"
     )
@@ -334,17 +605,69 @@ def main() -> None:
         help=f"Number of parallel workers (default: {Config.DEFAULT_WORKER_COUNT})",
     )
 
+    # ── Playlist throughput tuning ──
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=Config.DEFAULT_WORKER_COUNT,
+        help=f"Parallel videos per pipeline stage for playlist runs "
+             f"(default: {Config.DEFAULT_WORKER_COUNT})",
+    )
+
+    parser.add_argument(
+        "--rps",
+        type=float,
+        default=Config.DEFAULT_YT_RPS,
+        help=f"Global YouTube requests-per-second ceiling across all "
+             f"workers (default: {Config.DEFAULT_YT_RPS})",
+    )
+
+    return parser
+
+
+def main() -> None:
+    """
+    Main function — the entry point of the entire agent.
+
+    Handles:
+    - Single video processing
+    - Playlist processing
+    - Async queue submission
+    - Queue status display
+    - Worker management
+    - Hidden --_daemon flag (for PyInstaller binary worker daemon)
+    """
+
+    # ── Hidden daemon entry point (PyInstaller binary only) ──
+    # When running as a frozen binary, `start_daemon()` in worker.py
+    # can't use `python -c "..."` because sys.executable IS the binary,
+    # not the Python interpreter. Instead, it re-invokes the binary with
+    # `--_daemon N` which we intercept here BEFORE argparse runs.
+    # This must happen early — no banner, no logging setup, just launch
+    # the daemon directly.
+    if len(sys.argv) >= 2 and sys.argv[1] == "--_daemon":
+        worker_count = int(sys.argv[2]) if len(sys.argv) >= 3 else Config.DEFAULT_WORKER_COUNT
+        from worker import _run_daemon
+        _run_daemon(worker_count)
+        return
+
+    parser = _build_parser()
+
     args = parser.parse_args()
 
+    # Resolve the transcript language once, as a local. Workers receive it
+    # as an explicit argument — Config is never mutated at runtime, so
+    # parallel pipelines can't cross-contaminate each other's language.
+    language = args.language or Config.TRANSCRIPT_LANGUAGE
+
     # ══════════════════════════════════════════════
-    # STARTUP
+    # FAST PATHS (no logging setup, no banner)
     # ══════════════════════════════════════════════
-
-    setup_logging(level=Config.LOG_LEVEL, log_file=Config.LOG_FILE_PATH)
-    print_banner()
-
-    if args.language:
-        Config.TRANSCRIPT_LANGUAGE = args.language
+    # --show-config, --status, and --worker are quick read-mostly commands
+    # that get invoked frequently (shell prompts, monitoring scripts,
+    # watch loops). They print directly and never touch the logger, so we
+    # return before paying for setup_logging (mkdir + log file open) and
+    # the banner. Only the actual processing paths below need either.
 
     if args.show_config:
         Config.print_config()
@@ -359,15 +682,16 @@ def main() -> None:
 
     # ── Worker management ──
     if args.worker:
-        from worker import start_daemon, stop_daemon
-        from queue_manager import QueueManager
         worker_count = args.workers or Config.DEFAULT_WORKER_COUNT
 
         if args.worker == "start":
+            from worker import start_daemon
             start_daemon(worker_count)
         elif args.worker == "stop":
+            from worker import stop_daemon
             stop_daemon()
         elif args.worker == "status":
+            from queue_manager import QueueManager
             qm = QueueManager()
             state = qm.get_worker_state()
             if state and state["status"] == "running":
@@ -376,6 +700,13 @@ def main() -> None:
                 print("○ Worker not running")
         return
 
+    # ══════════════════════════════════════════════
+    # STARTUP
+    # ══════════════════════════════════════════════
+
+    setup_logging(level=Config.LOG_LEVEL, log_file=Config.LOG_FILE_PATH)
+    print_banner()
+
     # ── Check that a URL was provided ──
     if not args.url:
         parser.print_help()
@@ -389,7 +720,7 @@ def main() -> None:
         qm = QueueManager()
         job_id = qm.enqueue(
             url=args.url,
-            language=Config.TRANSCRIPT_LANGUAGE,
+            language=language,
             no_notion=args.no_notion,
         )
         print(f"📥 Job #{job_id} queued: {args.url}")
@@ -405,22 +736,21 @@ def main() -> None:
     if errors:
         logger.error("❌ Configuration errors:")
         for error in errors:
-            logger.error(f"   • {error}")
+            logger.error("   • %s", error)
         logger.error("\n📝 Copy .env.example to .env and fill in your values.")
         sys.exit(1)
 
     start_time = time.time()
 
     try:
-        from playlist import is_playlist_url
-
-        if is_playlist_url(args.url):
-            _process_playlist(args.url, args.no_notion)
+        if _PLAYLIST_URL_RE.search(args.url):
+            _process_playlist(args.url, args.no_notion, language,
+                              args.concurrency, args.rps)
         else:
-            _process_single_url(args.url, args.no_notion)
+            _process_single_url(args.url, args.no_notion, language)
 
         elapsed = time.time() - start_time
-        logger.info(f"\n⏱️  Total time: {elapsed:.1f} seconds")
+        logger.info("\n⏱️  Total time: %.1f seconds", elapsed)
         logger.info("✨ Done!")
 
     except KeyboardInterrupt:
@@ -428,12 +758,12 @@ def main() -> None:
         sys.exit(0)
 
     except Exception as e:
-        logger.error(f"\n❌ Error: {e}")
+        logger.error("\n❌ Error: %s", e)
         logger.error("\n💡 Tips:")
         logger.error("   • Check that the URL is correct and has captions/transcript")
         logger.error("   • Verify your AWS credentials and Bedrock model access")
         logger.error("   • Make sure your Notion integration has access to the target page")
-        logger.debug(f"Full error: {type(e).__name__}: {e}", exc_info=True)
+        logger.debug("Full error: %s: %s", type(e).__name__, e, exc_info=True)
         sys.exit(1)
 
 
@@ -94,7 +94,6 @@ pyinstaller \
     --hidden-import=youtube_transcript_api \
     --hidden-import=yt_dlp \
     --hidden-import=notion_client \
-    --hidden-import=dotenv \
     --hidden-import=botocore \
     --hidden-import=boto3 \
     --hidden-import=pydantic \
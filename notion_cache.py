@@ -0,0 +1,134 @@
+"""
+notion_cache.py — TubeWise Notion Publish Dedup Cache (SQLite)
+===============================================================
+Remembers which summaries have already been published to Notion so that
+re-running TubeWise on the same video (or re-running a whole playlist)
+skips the Notion POSTs — each publish is a page create plus block
+appends, ~300ms–800ms of network round-trips per video.
+
+HOW IT WORKS:
+- Each published video is stored as video_id → (summary_hash, page_url),
+  where summary_hash is a BLAKE2b digest of the raw summary text.
+- On a re-run, if the summary hash is unchanged we reuse the stored page
+  URL without calling publish_to_notion(). If the summary changed (new
+  transcript, different model/prompts), the hash differs and we publish
+  a fresh page.
+- Storage is a small SQLite database at ~/.tubewise/notion_cache.db
+  using WAL mode, same pattern as llm_cache.py and queue_manager.py.
+
+BLAKE2b is used instead of SHA-256 because it's ~3x faster in pure
+Python stdlib and a 16-byte digest is plenty for change detection.
+
+USAGE:
+    import notion_cache
+
+    summary_hash = notion_cache.make_hash(raw_summary)
+    page_url = notion_cache.lookup(video_id, summary_hash)
+    if page_url is None:
+        page_url = publish_to_notion(...)
+        notion_cache.put(video_id, summary_hash, page_url)
+
+Shares the ENABLE_LLM_CACHE toggle with the summary cache — disabling
+caching disables both.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import sqlite3
+from pathlib import Path
+
+from config import Config
+
+logger = logging.getLogger("tubewise.notion_cache")
+
+
+def _get_conn() -> sqlite3.Connection:
+    """Open the cache database, creating the table on first use."""
+    db_path = Config.NOTION_CACHE_DB_PATH
+    Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(db_path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA busy_timeout=5000")
+    conn.execute(
+        """CREATE TABLE IF NOT EXISTS published_pages (
+            video_id TEXT PRIMARY KEY,
+            summary_hash TEXT NOT NULL,
+            page_url TEXT NOT NULL,
+            created_at TEXT DEFAULT (datetime('now'))
+        )"""
+    )
+    return conn
+
+
+def make_hash(raw_summary: str) -> str:
+    """
+    Hash a summary for change detection.
+
+    Args:
+        raw_summary: The raw summary text from Claude
+
+    Returns:
+        32-char hex BLAKE2b digest (16 bytes)
+    """
+    return hashlib.blake2b(raw_summary.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def lookup(video_id: str, summary_hash: str) -> str | None:
+    """
+    Return the stored Notion page URL if this exact summary was already
+    published for this video.
+
+    Args:
+        video_id:     The video/content ID
+        summary_hash: Hash from make_hash()
+
+    Returns:
+        The previously published page URL, or None if the video was never
+        published, the summary has changed since, or caching is disabled /
+        the cache DB is unreadable.
+    """
+    if not Config.ENABLE_LLM_CACHE:
+        return None
+    try:
+        conn = _get_conn()
+        try:
+            row = conn.execute(
+                "SELECT page_url FROM published_pages "
+                "WHERE video_id = ? AND summary_hash = ?",
+                (video_id, summary_hash),
+            ).fetchone()
+            return row[0] if row else None
+        finally:
+            conn.close()
+    except sqlite3.Error as e:
+        # A broken cache should never break the pipeline — treat as a miss
+        logger.debug(f"Notion cache read failed: {e}")
+        return None
+
+
+def put(video_id: str, summary_hash: str, page_url: str) -> None:
+    """
+    Record a published page so future runs can skip the POST.
+
+    Args:
+        video_id:     The video/content ID
+        summary_hash: Hash from make_hash()
+        page_url:     URL of the created Notion page
+    """
+    if not Config.ENABLE_LLM_CACHE or not page_url:
+        return
+    try:
+        conn = _get_conn()
+        try:
+            conn.execute(
+                "INSERT OR REPLACE INTO published_pages "
+                "(video_id, summary_hash, page_url) VALUES (?, ?, ?)",
+                (video_id, summary_hash, page_url),
+            )
+            conn.commit()
+        finally:
+            conn.close()
+    except sqlite3.Error as e:
+        logger.debug(f"Notion cache write failed: {e}")
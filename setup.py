@@ -69,7 +69,6 @@ setup(
         "youtube-transcript-api>=0.6.2",
         "yt-dlp>=2024.0.0",
         "notion-client>=2.2.0",
-        "python-dotenv>=1.0.0",
         "pydantic>=2.0.0",
     ],
 
@@ -108,5 +107,6 @@ setup(
     },
 
     # ── Python version requirement ──
-    python_requires=">=3.9",
+    # 3.10+ because the data models use dataclass(slots=True)
+    python_requires=">=3.10",
 )
\ No newline at end of file
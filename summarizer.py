@@ -35,14 +35,18 @@ CUSTOMIZATION:
 
 from __future__ import annotations
 
+import functools
 import logging
+from typing import TYPE_CHECKING
 
-from langchain_aws import ChatBedrock
-from langchain_core.messages import SystemMessage, HumanMessage
-from langchain_text_splitters import RecursiveCharacterTextSplitter
-import boto3
-import botocore
-from botocore.config import Config as BotoConfig
+# NOTE: langchain_aws / boto3 are NOT imported at module level on purpose.
+# `from langchain_aws import ChatBedrock` alone takes ~500ms (it pulls in
+# NumPy, OpenBLAS, Neptune graph DB, embeddings, etc.), so even just
+# `import summarizer` would eat that cost — including on CLI paths that
+# never touch Bedrock. Each function below imports exactly what it needs
+# on first use; Python's module cache makes repeat imports free.
+if TYPE_CHECKING:
+    from langchain_aws import ChatBedrock
 
 from config import Config
 from models import ContentInfo
@@ -59,6 +63,82 @@ logger = logging.getLogger("tubewise.summarizer")
 VideoInfo = ContentInfo
 
 
+# ══════════════════════════════════════════════════════════════
+# PROMPT CACHING
+# ══════════════════════════════════════════════════════════════
+# Every LLM call re-sends the same SYSTEM_PROMPT. Bedrock can cache it
+# server-side: we mark the system prompt with a cache checkpoint, and on
+# repeat calls Bedrock reads it from cache at ~10% of the input-token
+# price (and with lower time-to-first-token). Playlist runs and the
+# map-reduce chunk loop — many calls, identical system prompt — are the
+# big winners.
+#
+# Only Claude 3.5+ models support this, so we gate on a model allowlist.
+
+# Model families that support Bedrock prompt caching. Matched by prefix
+# after stripping the cross-region routing prefix (us./eu./apac./global.)
+# from the configured model ID.
+_PROMPT_CACHE_MODEL_PREFIXES = (
+    "anthropic.claude-3-5-sonnet-20241022-v2",
+    "anthropic.claude-3-5-haiku",
+    "anthropic.claude-3-7-sonnet",
+    "anthropic.claude-sonnet-4",
+    "anthropic.claude-haiku-4",
+    "anthropic.claude-opus-4",
+)
+
+# Cross-region inference profile prefixes (e.g. "us.anthropic.claude-...")
+_REGION_ROUTING_PREFIXES = ("us.", "eu.", "apac.", "global.")
+
+
+def _model_supports_prompt_cache(model_id: str | None = None) -> bool:
+    """
+    Check whether the configured Bedrock model supports prompt caching.
+
+    Args:
+        model_id: Model ID to check (defaults to Config.BEDROCK_MODEL_ID)
+
+    Returns:
+        True if cache checkpoints can be sent to this model
+    """
+    model_id = model_id or Config.BEDROCK_MODEL_ID
+    for prefix in _REGION_ROUTING_PREFIXES:
+        if model_id.startswith(prefix):
+            model_id = model_id[len(prefix):]
+            break
+    return model_id.startswith(_PROMPT_CACHE_MODEL_PREFIXES)
+
+
+def _build_messages(prompt: str) -> list:
+    """
+    Build the [system, human] message pair for an LLM call.
+
+    When prompt caching is enabled AND the model supports it, the system
+    prompt is sent as a content block with a cache checkpoint so Bedrock
+    caches it across calls. Otherwise it's sent as a plain string —
+    identical behavior to before, just without the cache hint.
+
+    Args:
+        prompt: The human/user prompt text
+
+    Returns:
+        List of [SystemMessage, HumanMessage]
+    """
+    from langchain_core.messages import SystemMessage, HumanMessage
+
+    if Config.ENABLE_BEDROCK_PROMPT_CACHE and _model_supports_prompt_cache():
+        system = SystemMessage(content=[
+            {
+                "type": "text",
+                "text": SYSTEM_PROMPT,
+                "cache_control": {"type": "ephemeral"},
+            }
+        ])
+    else:
+        system = SystemMessage(content=SYSTEM_PROMPT)
+    return [system, HumanMessage(content=prompt)]
+
+
 # ══════════════════════════════════════════════════════════════
 # LLM INITIALIZATION
 # ══════════════════════════════════════════════════════════════
@@ -88,6 +168,10 @@ def _create_bedrock_client_with_bearer_token():
     Returns:
         boto3 bedrock-runtime client configured with bearer token auth
     """
+    import boto3
+    import botocore
+    from botocore.config import Config as BotoConfig
+
     # ── Create a boto3 session without any IAM credentials ──
     # We pass empty strings because we don't want boto3 to use IAM auth.
     # The bearer token will handle authentication instead.
@@ -133,10 +217,16 @@ def _create_bedrock_client_with_bearer_token():
     return client
 
 
+@functools.lru_cache(maxsize=1)
 def get_llm() -> ChatBedrock:
     """
     Initialize and return the Bedrock LLM client.
-    
+
+    The client is created once and reused for every summary in the process
+    (boto3 clients are thread-safe, so this is fine under the playlist
+    thread pool too). Recreating it per video would redo credential
+    resolution and TLS setup on every iteration.
+
     AUTHENTICATION FLOW:
     1. Check if Bearer Token is set (AWS_BEARER_TOKEN_BEDROCK in .env)
        → If yes: Create a custom boto3 client with bearer token auth
@@ -157,7 +247,11 @@ def get_llm() -> ChatBedrock:
     - "ResourceNotFoundException" → The model isn't available in your region
     - "ValidationException" → Check the model ID format
     """
-    
+    # Lazy import: this is the ~500ms langchain_aws chain — only pay for
+    # it when we're actually about to call Bedrock
+    from langchain_aws import ChatBedrock
+    from botocore.config import Config as BotoConfig
+
     if Config.is_bearer_token_auth():
         # ── BEARER TOKEN AUTH ──
         # Create a custom boto3 client with the bearer token injected
@@ -205,6 +299,31 @@ def get_llm() -> ChatBedrock:
         )
 
 
+def _invoke(llm: ChatBedrock, messages: list) -> str:
+    """
+    Send messages to Claude and return the response text, streaming it in.
+
+    Streaming accumulates the response chunk-by-chunk as Bedrock produces
+    it, instead of buffering the entire completion server-side and
+    receiving it in one blob. For long summaries this keeps per-call
+    memory at O(chunk) on the wire and surfaces network errors sooner.
+    Falls back to a blocking .invoke() if the client can't stream.
+
+    Args:
+        llm:      The ChatBedrock LLM client
+        messages: Message list from _build_messages()
+
+    Returns:
+        The complete response text
+    """
+    try:
+        pieces = [chunk.content for chunk in llm.stream(messages)]
+    except (NotImplementedError, AttributeError):
+        # Client/model without streaming support — one-shot invoke
+        return llm.invoke(messages).content
+    return "".join(pieces)
+
+
 # ══════════════════════════════════════════════════════════════
 # STRATEGY 1: SHORT VIDEO (Single-Shot Summarization)
 # ══════════════════════════════════════════════════════════════
@@ -243,16 +362,13 @@ def summarize_short(llm: ChatBedrock, video: VideoInfo) -> str:
     # - SystemMessage: Tells Claude WHO it is (its role, personality)
     # - HumanMessage: The actual question/prompt we want answered
     # This mirrors how ChatGPT/Claude conversations work internally.
-    messages = [
-        SystemMessage(content=SYSTEM_PROMPT),   # "You are an expert content analyst..."
-        HumanMessage(content=prompt),            # "Here's the transcript, summarize it..."
-    ]
+    # _build_messages adds a prompt-cache checkpoint on the system prompt
+    # when the model supports it.
+    messages = _build_messages(prompt)
 
     # ── Send to Claude via Bedrock and get response ──
-    # .invoke() sends the request, waits for Claude to process, and returns the response
-    # response.content contains the actual text output from Claude
-    response = llm.invoke(messages)
-    return response.content
+    # _invoke() streams the response in and returns the full text
+    return _invoke(llm, messages)
 
 
 # ══════════════════════════════════════════════════════════════
@@ -300,7 +416,8 @@ def summarize_long(llm: ChatBedrock, video: VideoInfo) -> str:
     Returns:
         Raw summary text from Claude (combined from all chunks)
     """
-    
+    from langchain_text_splitters import RecursiveCharacterTextSplitter
+
     # ══════════════════════════════════════════════
     # STEP 1: SPLIT the transcript into chunks
     # ══════════════════════════════════════════════
@@ -344,15 +461,10 @@ def summarize_long(llm: ChatBedrock, video: VideoInfo) -> str:
         )
 
         # Send to Claude
-        messages = [
-            SystemMessage(content=SYSTEM_PROMPT),
-            HumanMessage(content=prompt),
-        ]
+        messages = _build_messages(prompt)
 
-        response = llm.invoke(messages)
-        
         # Store the summary with a section label for the reduce step
-        chunk_summaries.append(f"--- Section {i + 1} ---\n{response.content}")
+        chunk_summaries.append(f"--- Section {i + 1} ---\n{_invoke(llm, messages)}")
 
     # ══════════════════════════════════════════════
     # STEP 3: REDUCE — combine all chunk summaries
@@ -374,13 +486,9 @@ def summarize_long(llm: ChatBedrock, video: VideoInfo) -> str:
     )
 
     # Send to Claude for final combination
-    messages = [
-        SystemMessage(content=SYSTEM_PROMPT),
-        HumanMessage(content=reduce_prompt),
-    ]
+    messages = _build_messages(reduce_prompt)
 
-    response = llm.invoke(messages)
-    return response.content
+    return _invoke(llm, messages)
 
 
 # ══════════════════════════════════════════════════════════════
@@ -7,7 +7,54 @@ from __future__ import annotations
 import os
 import pytest
 
-from config import Config
+from config import Config, _parse_env_file
+
+
+class TestParseEnvFile:
+    """Test the in-house .env parser that replaced python-dotenv."""
+
+    @pytest.fixture
+    def env_file(self, tmp_path):
+        def write(content: str):
+            path = tmp_path / ".env"
+            path.write_text(content)
+            return path
+        return write
+
+    def test_basic_key_value(self, env_file):
+        values = _parse_env_file(env_file("LOG_LEVEL=INFO\n"))
+        assert values == {"LOG_LEVEL": "INFO"}
+
+    def test_quoted_values(self, env_file):
+        values = _parse_env_file(env_file('A="double"\nB=\'single\'\n'))
+        assert values == {"A": "double", "B": "single"}
+
+    def test_inline_comment_stripped(self, env_file):
+        values = _parse_env_file(env_file("DEFAULT_WORKER_COUNT=2  # workers\n"))
+        assert values == {"DEFAULT_WORKER_COUNT": "2"}
+
+    def test_inline_comment_after_quoted_value(self, env_file):
+        values = _parse_env_file(env_file('TITLE="a # b"  # comment\n'))
+        assert values == {"TITLE": "a # b"}
+
+    def test_hash_without_whitespace_kept(self, env_file):
+        values = _parse_env_file(env_file("PASSWORD=pass#word\n"))
+        assert values == {"PASSWORD": "pass#word"}
+
+    def test_export_prefix(self, env_file):
+        values = _parse_env_file(env_file("export NOTION_TOKEN=secret_abc\n"))
+        assert values == {"NOTION_TOKEN": "secret_abc"}
+
+    def test_blank_and_comment_lines_skipped(self, env_file):
+        values = _parse_env_file(env_file("# comment\n\nKEY=value\n"))
+        assert values == {"KEY": "value"}
+
+    def test_whitespace_around_key_and_value(self, env_file):
+        values = _parse_env_file(env_file("KEY = padded value  \n"))
+        assert values == {"KEY": "padded value"}
+
+    def test_missing_file_returns_empty(self, tmp_path):
+        assert _parse_env_file(tmp_path / "nope.env") == {}
 
 
 class TestConfigValidate:
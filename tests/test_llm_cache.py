@@ -0,0 +1,66 @@
+"""
+test_llm_cache.py — Unit tests for llm_cache.py
+"""
+
+from __future__ import annotations
+
+import pytest
+
+import llm_cache
+from config import Config
+
+
+@pytest.fixture
+def cache_db(tmp_path, monkeypatch):
+    """Point the cache at a temp database and make sure caching is on."""
+    monkeypatch.setattr(Config, "LLM_CACHE_DB_PATH", str(tmp_path / "llm_cache.db"))
+    monkeypatch.setattr(Config, "ENABLE_LLM_CACHE", True)
+
+
+class TestMakeKey:
+    """Test cache key generation."""
+
+    def test_key_is_hex_sha256(self, cache_db):
+        key = llm_cache.make_key("abc123def45", "some transcript")
+        assert len(key) == 64
+        assert all(c in "0123456789abcdef" for c in key)
+
+    def test_key_is_deterministic(self, cache_db):
+        k1 = llm_cache.make_key("abc123def45", "some transcript")
+        k2 = llm_cache.make_key("abc123def45", "some transcript")
+        assert k1 == k2
+
+    def test_key_changes_with_transcript(self, cache_db):
+        k1 = llm_cache.make_key("abc123def45", "transcript one")
+        k2 = llm_cache.make_key("abc123def45", "transcript two")
+        assert k1 != k2
+
+    def test_key_changes_with_model(self, cache_db, monkeypatch):
+        k1 = llm_cache.make_key("abc123def45", "some transcript")
+        monkeypatch.setattr(Config, "BEDROCK_MODEL_ID", "some.other.model")
+        k2 = llm_cache.make_key("abc123def45", "some transcript")
+        assert k1 != k2
+
+
+class TestGetPut:
+    """Test cache storage round-trips."""
+
+    def test_miss_returns_none(self, cache_db):
+        assert llm_cache.get("0" * 64) is None
+
+    def test_put_then_get(self, cache_db):
+        key = llm_cache.make_key("abc123def45", "some transcript")
+        llm_cache.put(key, "### SUMMARY\nCached summary text")
+        assert llm_cache.get(key) == "### SUMMARY\nCached summary text"
+
+    def test_put_overwrites(self, cache_db):
+        key = llm_cache.make_key("abc123def45", "some transcript")
+        llm_cache.put(key, "old")
+        llm_cache.put(key, "new")
+        assert llm_cache.get(key) == "new"
+
+    def test_disabled_cache_always_misses(self, cache_db, monkeypatch):
+        key = llm_cache.make_key("abc123def45", "some transcript")
+        llm_cache.put(key, "cached")
+        monkeypatch.setattr(Config, "ENABLE_LLM_CACHE", False)
+        assert llm_cache.get(key) is None
@@ -0,0 +1,63 @@
+"""
+test_notion_cache.py — Unit tests for notion_cache.py
+"""
+
+from __future__ import annotations
+
+import pytest
+
+import notion_cache
+from config import Config
+
+
+@pytest.fixture
+def cache_db(tmp_path, monkeypatch):
+    """Point the cache at a temp database and make sure caching is on."""
+    monkeypatch.setattr(
+        Config, "NOTION_CACHE_DB_PATH", str(tmp_path / "notion_cache.db")
+    )
+    monkeypatch.setattr(Config, "ENABLE_LLM_CACHE", True)
+
+
+class TestMakeHash:
+    """Test summary hashing."""
+
+    def test_hash_is_hex_blake2b(self, cache_db):
+        h = notion_cache.make_hash("### SUMMARY\nSome text")
+        assert len(h) == 32
+        assert all(c in "0123456789abcdef" for c in h)
+
+    def test_hash_changes_with_summary(self, cache_db):
+        h1 = notion_cache.make_hash("summary one")
+        h2 = notion_cache.make_hash("summary two")
+        assert h1 != h2
+
+
+class TestLookupPut:
+    """Test publish dedup round-trips."""
+
+    def test_miss_returns_none(self, cache_db):
+        h = notion_cache.make_hash("summary")
+        assert notion_cache.lookup("abc123def45", h) is None
+
+    def test_put_then_lookup(self, cache_db):
+        h = notion_cache.make_hash("summary")
+        notion_cache.put("abc123def45", h, "https://notion.so/page1")
+        assert notion_cache.lookup("abc123def45", h) == "https://notion.so/page1"
+
+    def test_changed_summary_misses(self, cache_db):
+        h1 = notion_cache.make_hash("old summary")
+        notion_cache.put("abc123def45", h1, "https://notion.so/page1")
+        h2 = notion_cache.make_hash("new summary")
+        assert notion_cache.lookup("abc123def45", h2) is None
+
+    def test_empty_url_not_stored(self, cache_db):
+        h = notion_cache.make_hash("summary")
+        notion_cache.put("abc123def45", h, "")
+        assert notion_cache.lookup("abc123def45", h) is None
+
+    def test_disabled_cache_always_misses(self, cache_db, monkeypatch):
+        h = notion_cache.make_hash("summary")
+        notion_cache.put("abc123def45", h, "https://notion.so/page1")
+        monkeypatch.setattr(Config, "ENABLE_LLM_CACHE", False)
+        assert notion_cache.lookup("abc123def45", h) is None
@@ -4,6 +4,8 @@ test_notion_publisher.py — Unit tests for notion_publisher.py pure functions
 
 from __future__ import annotations
 
+from dataclasses import astuple
+
 import pytest
 
 from notion_publisher import (
@@ -36,36 +38,36 @@ class TestParseSummarySections:
 
     def test_parses_all_sections(self, sample_raw_summary):
         sections = parse_summary_sections(sample_raw_summary)
-        assert "machine learning" in sections["summary"].lower()
-        assert "Supervised learning" in sections["key_takeaways"]
-        assert "Supervised Learning" in sections["topics_covered"]
-        assert "Gradient Descent" in sections["concept_explanations"]
-        assert "scikit-learn" in sections["action_items"]
-        assert "mermaid" in sections["diagram_description"]
-        assert "wrong" in sections["notable_quotes"]
-        assert "scikit-learn" in sections["resources_mentioned"]
+        assert "machine learning" in sections.summary.lower()
+        assert "Supervised learning" in sections.key_takeaways
+        assert "Supervised Learning" in sections.topics_covered
+        assert "Gradient Descent" in sections.concept_explanations
+        assert "scikit-learn" in sections.action_items
+        assert "mermaid" in sections.diagram_description
+        assert "wrong" in sections.notable_quotes
+        assert "scikit-learn" in sections.resources_mentioned
 
     def test_empty_input(self):
         sections = parse_summary_sections("")
-        assert all(v == "" for v in sections.values())
+        assert all(v == "" for v in astuple(sections))
 
     def test_missing_sections_are_empty(self):
         raw = "### SUMMARY\nJust a summary.\n"
         sections = parse_summary_sections(raw)
-        assert "Just a summary" in sections["summary"]
-        assert sections["key_takeaways"] == ""
-        assert sections["topics_covered"] == ""
+        assert "Just a summary" in sections.summary
+        assert sections.key_takeaways == ""
+        assert sections.topics_covered == ""
 
     def test_unknown_section_ignored(self):
         raw = "### RANDOM_SECTION\nThis should be ignored.\n### SUMMARY\nActual summary."
         sections = parse_summary_sections(raw)
-        assert "Actual summary" in sections["summary"]
+        assert "Actual summary" in sections.summary
 
     def test_multiline_section_content(self):
         raw = "### SUMMARY\nLine 1\nLine 2\nLine 3"
         sections = parse_summary_sections(raw)
-        assert "Line 1" in sections["summary"]
-        assert "Line 3" in sections["summary"]
+        assert "Line 1" in sections.summary
+        assert "Line 3" in sections.summary
 
 
 # ══════════════════════════════════════════════════════════════
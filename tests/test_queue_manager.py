@@ -29,6 +29,17 @@ class TestQueueManager:
         id2 = qm.enqueue("https://youtube.com/watch?v=def456")
         assert id2 == id1 + 1
 
+    def test_enqueue_many_returns_sequential_ids(self, qm):
+        urls = [f"https://youtube.com/watch?v=video{i}" for i in range(3)]
+        ids = qm.enqueue_many(urls)
+        assert len(ids) == 3
+        assert ids == [ids[0], ids[0] + 1, ids[0] + 2]
+        jobs = qm.get_status()
+        assert len(jobs) == 3
+
+    def test_enqueue_many_empty_list(self, qm):
+        assert qm.enqueue_many([]) == []
+
     def test_enqueue_detects_youtube(self, qm):
         qm.enqueue("https://youtube.com/watch?v=abc123")
         jobs = qm.get_status(limit=1)
@@ -89,6 +100,27 @@ class TestQueueManager:
         jobs = qm.get_status()
         assert jobs[0]["status"] == "pending"
 
+    def test_prune_removes_old_finished_jobs(self, qm):
+        for i in range(5):
+            job_id = qm.enqueue(f"https://youtube.com/watch?v=video{i}")
+            qm.get_next_pending()
+            qm.mark_completed(job_id)
+        deleted = qm.prune(keep_last=2)
+        assert deleted == 3
+        assert len(qm.get_status()) == 2
+
+    def test_prune_keeps_pending_jobs(self, qm):
+        old_id = qm.enqueue("https://youtube.com/watch?v=old")
+        for i in range(3):
+            qm.enqueue(f"https://youtube.com/watch?v=video{i}")
+        assert qm.prune(keep_last=1) == 0
+        statuses = [j["status"] for j in qm.get_status()]
+        assert statuses == ["pending"] * 4
+
+    def test_prune_small_table_noop(self, qm):
+        qm.enqueue("https://youtube.com/watch?v=abc123")
+        assert qm.prune(keep_last=1000) == 0
+
     def test_worker_state_lifecycle(self, qm):
         state = qm.get_worker_state()
         assert state["status"] == "stopped"
@@ -135,6 +167,15 @@ class TestTruncate:
 class TestCalcDuration:
     """Test the _calc_duration helper function."""
 
+    def test_epoch_seconds(self):
+        assert _calc_duration(1000, 1045) == "45s"
+
+    def test_epoch_minutes(self):
+        assert _calc_duration(1000, 1150) == "2m 30s"
+
+    def test_epoch_hours(self):
+        assert _calc_duration(1000, 6400) == "1h 30m"
+
     def test_seconds(self):
         assert _calc_duration("2024-01-01 00:00:00", "2024-01-01 00:00:45") == "45s"
 
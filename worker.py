@@ -223,6 +223,11 @@ def run_worker(worker_count: int) -> None:
     if reset_count:
         logger.info(f"Reset {reset_count} stale job(s) from previous run")
 
+    # Trim old finished jobs so the hot table stays small
+    pruned = qm.prune()
+    if pruned:
+        logger.info(f"Pruned {pruned} old finished job(s)")
+
     logger.info(f"Worker started (PID: {os.getpid()}, {worker_count} workers)")
 
     # ── Use forkserver to avoid macOS fork-safety crashes ──